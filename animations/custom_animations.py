@@ -2,7 +2,12 @@
 Custom animation classes for Sanim.
 """
 
-from manim_engine.big_ol_pile_of_manim_imports import *
+import numpy as np
+
+from manim_engine.animation.creation import DrawBorderThenFill
+from manim_engine.mobject.svg.tex_mobject import TextMobject
+from manim_engine.utils.config_ops import digest_config
+from manim_engine.utils.rate_functions import smooth
 
 class CustomWrite(DrawBorderThenFill):
     """Custom animation for text with a unique reveal style."""
@@ -2,7 +2,10 @@
 Base classes for Sanim elements.
 """
 
-from manim_engine.big_ol_pile_of_manim_imports import *
+import copy
+
+from manim_engine.mobject.mobject import Mobject
+from util.positioning import get_layout_proxy
 
 class OutputElement:
     """
@@ -19,6 +22,22 @@ class OutputElement:
         self.input_elem = input_elem
         self.wait_for_input = input_elem.should_wait_for_input()
     
+    @staticmethod
+    def get_tex_requirements(input_elem):
+        """
+        Get the TeX files an element built from input_elem will compile.
+        
+        Used to compile them all in parallel before any element is built.
+        Invalid input may return an empty list; the constructor reports it.
+        
+        Args:
+            input_elem: The input element the output element would be based on
+            
+        Returns:
+            List of (expression, template_tex_file_body) pairs
+        """
+        return []
+    
     def individual_play(self, scene):
         """
         Animate the element in the scene.
@@ -97,6 +116,15 @@ class OutputElement:
         """
         raise NotImplementedError("Subclasses must implement this method")
     
+    def get_mobjects(self):
+        """
+        Get the mobjects that display this element.
+        
+        Returns:
+            List of mobjects
+        """
+        raise NotImplementedError("Subclasses must implement this method")
+    
     def get_fade_out_actions(self):
         """
         Get animations to fade out this element.
@@ -110,7 +138,29 @@ class OutputElement:
         """
         Create a copy of this element.
         
+        The mobjects are copied rather than built again from the input.
+        
         Returns:
             A new instance of this element
         """
-        raise NotImplementedError("Subclasses must implement this method")
+        result = copy.copy(self)
+        for name, value in vars(self).items():
+            if isinstance(value, Mobject):
+                setattr(result, name, value.copy())
+        return result
+    
+    def get_layout_copy(self):
+        """
+        Create a copy of this element for computing layout.
+        
+        Its mobjects are layout proxies, which can be positioned like the
+        real ones but not displayed.
+        
+        Returns:
+            A new instance of this element
+        """
+        result = copy.copy(self)
+        for name, value in vars(self).items():
+            if isinstance(value, Mobject):
+                setattr(result, name, get_layout_proxy(value))
+        return result
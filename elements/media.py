@@ -2,7 +2,10 @@
 Media-based elements for Sanim.
 """
 
-from manim_engine.big_ol_pile_of_manim_imports import *
+from manim_engine.constants import *
+from manim_engine.animation.creation import FadeIn, FadeOut
+from manim_engine.animation.transform import ApplyMethod
+from manim_engine.mobject.types.image_mobject import ImageMobject
 from .base import OutputElement
 from util.exceptions import SanimParseError, SanimRenderError
 
@@ -51,10 +54,6 @@ class ImageElement(OutputElement):
         except Exception as e:
             raise SanimRenderError(f"Failed to load image {image_path}: {str(e)}")
     
-    def copy(self):
-        """Create a copy of this element."""
-        return ImageElement(self.input_elem)
-    
     def individual_play(self, scene):
         """Animate the image in the scene."""
         scene.play(FadeIn(self.image), run_time=self.run_time)
@@ -96,26 +95,18 @@ class ImageElement(OutputElement):
     
     def get_shift_left_aligned_actions(self, position):
         """Get animations to shift this image to be left-aligned at the given position."""
-        # Create a target position object for positioning
-        temp_image = self.image.copy()  # Used only for positioning
-        
-        # First align the top with current position (to avoid overlap)
-        temp_image.move_to(position)
-        current_top = temp_image.get_top()
-        target_top = position.get_center() + UP * 0.1  # Small buffer
-        temp_image.shift(target_top - current_top)
-        
-        # Center horizontally in the frame
-        center_x = ORIGIN[0]  # X-coordinate of the center of the screen
-        current_x = temp_image.get_center()[0]  # Current X-coordinate
-        temp_image.shift(RIGHT * (center_x - current_x))
-        
-        return [ApplyMethod(self.image.move_to, temp_image)]
+        target = self.get_layout_copy()
+        target.position_left_aligned(position)
+        return [ApplyMethod(self.image.move_to, target.image)]
     
     def get_bottom_position(self):
         """Get the position at the bottom of this image."""
         return self.image
     
+    def get_mobjects(self):
+        """Get the mobjects that display this image."""
+        return [self.image]
+    
     def get_fade_out_actions(self):
         """Get animations to fade out this image."""
         return [FadeOut(self.image)]
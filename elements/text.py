@@ -2,7 +2,11 @@
 Text-based elements for Sanim.
 """
 
-from manim_engine.big_ol_pile_of_manim_imports import *
+from manim_engine.constants import *
+from manim_engine.animation.creation import FadeOut
+from manim_engine.animation.transform import ApplyMethod
+from manim_engine.mobject.svg.tex_mobject import BulletedItem, TextMobject, Title
+from manim_engine.mobject.svg.tex_mobject import get_tex_file_requirements
 from .base import OutputElement
 from animations.custom_animations import CustomWrite
 from util.exceptions import SanimParseError
@@ -11,6 +15,24 @@ from util.exceptions import SanimParseError
 DEFINITION_COLOR = "#991f00"
 BACKGROUND_COLOR = "#e6f3ff"
 
+def split_quoted_term(content):
+    """
+    Split content of the form '"term" rest' into term and rest.
+    
+    Args:
+        content: The content of a DEF or TERM input element
+        
+    Returns:
+        Tuple (term, rest), or None if the content does not start with a quoted term
+    """
+    content = content.lstrip()
+    if not content or content[0] != '"':
+        return None
+    content = content[1:]
+    if '"' not in content:
+        return None
+    return content[:content.find('"')], content[content.find('"')+1:].lstrip()
+
 class TitleElement(OutputElement):
     """Element representing a title in the presentation."""
     
@@ -40,9 +62,18 @@ class TitleElement(OutputElement):
             background_stroke_color=BACKGROUND_COLOR
         )
     
-    def copy(self):
-        """Create a copy of this element."""
-        return TitleElement(self.input_elem)
+    @staticmethod
+    def get_tex_requirements(input_elem):
+        """Get the TeX files this title will compile."""
+        if not input_elem.content:
+            return []
+        return get_tex_file_requirements(
+            Title,
+            input_elem.content,
+            scale_factor=1.3,
+            color=BLACK,
+            background_stroke_color=BACKGROUND_COLOR
+        )
     
     def individual_play(self, scene):
         """Animate the title in the scene."""
@@ -71,16 +102,18 @@ class TitleElement(OutputElement):
     
     def get_shift_left_aligned_actions(self, position):
         """Get animations to shift this title to be left-aligned at the given position."""
-        # Create a temporary position
-        pos_title = TextMobject("aux")
-        pos_title.center()
-        pos_title.to_edge(UP)
-        return [ApplyMethod(self.text.move_to, pos_title)]
+        target = self.get_layout_copy()
+        target.position_left_aligned(position)
+        return [ApplyMethod(self.text.move_to, target.text)]
     
     def get_bottom_position(self):
         """Get the position at the bottom of this title."""
         return self.text
     
+    def get_mobjects(self):
+        """Get the mobjects that display this title."""
+        return [self.text]
+    
     def get_fade_out_actions(self):
         """Get animations to fade out this title."""
         return [FadeOut(self.text)]
@@ -118,9 +151,15 @@ class PlainTextElement(OutputElement):
             self.run_time = 0.6 + len(content) / 150
             self.is_empty = False
     
-    def copy(self):
-        """Create a copy of this element."""
-        return PlainTextElement(self.input_elem)
+    @staticmethod
+    def get_tex_requirements(input_elem):
+        """Get the TeX files this text will compile."""
+        return get_tex_file_requirements(
+            TextMobject,
+            input_elem.content or "aux",
+            color=BLACK,
+            background_stroke_color=BACKGROUND_COLOR
+        )
     
     def individual_play(self, scene):
         """Animate the text in the scene."""
@@ -157,17 +196,18 @@ class PlainTextElement(OutputElement):
         if self.is_empty:
             return []
         
-        # Create a temporary mobject for positioning
-        pos_text = TextMobject("aux")
-        pos_text.move_to(position)
-        pos_text.to_edge(LEFT)
-        
-        return [ApplyMethod(self.text.move_to, pos_text)]
+        target = self.get_layout_copy()
+        target.position_left_aligned(position)
+        return [ApplyMethod(self.text.move_to, target.text)]
     
     def get_bottom_position(self):
         """Get the position at the bottom of this text."""
         return self.text
     
+    def get_mobjects(self):
+        """Get the mobjects that display this text."""
+        return [self.text]
+    
     def get_fade_out_actions(self):
         """Get animations to fade out this text."""
         if self.is_empty:
@@ -201,9 +241,17 @@ class BulletElement(OutputElement):
         )
         self.run_time = 0.6 + len(content) / 150
     
-    def copy(self):
-        """Create a copy of this element."""
-        return BulletElement(self.input_elem)
+    @staticmethod
+    def get_tex_requirements(input_elem):
+        """Get the TeX files this bullet will compile."""
+        if not input_elem.content:
+            return []
+        return get_tex_file_requirements(
+            BulletedItem,
+            input_elem.content,
+            color=BLACK,
+            background_stroke_color=BACKGROUND_COLOR
+        )
     
     def individual_play(self, scene):
         """Animate the bullet in the scene."""
@@ -232,17 +280,18 @@ class BulletElement(OutputElement):
     
     def get_shift_left_aligned_actions(self, position):
         """Get animations to shift this bullet to be left-aligned at the given position."""
-        # Create a temporary mobject for positioning
-        pos_text = BulletedItem(self.input_elem.content)
-        pos_text.move_to(position)
-        pos_text.to_edge(LEFT)
-        
-        return [ApplyMethod(self.text.move_to, pos_text)]
+        target = self.get_layout_copy()
+        target.position_left_aligned(position)
+        return [ApplyMethod(self.text.move_to, target.text)]
     
     def get_bottom_position(self):
         """Get the position at the bottom of this bullet."""
         return self.text
     
+    def get_mobjects(self):
+        """Get the mobjects that display this bullet."""
+        return [self.text]
+    
     def get_fade_out_actions(self):
         """Get animations to fade out this bullet."""
         return [FadeOut(self.text)]
@@ -262,19 +311,12 @@ class DefinitionElement(OutputElement):
             SanimParseError: If the definition syntax is invalid
         """
         super().__init__(input_elem)
-        content = input_elem.content.lstrip()
         
         # Parse term and definition
-        if not content or content[0] != '"':
+        split_content = split_quoted_term(input_elem.content)
+        if split_content is None:
             raise SanimParseError('Invalid use of DEF. Syntax: DEF "term" definition')
-        
-        content = content[1:]
-        if '"' not in content:
-            raise SanimParseError('Invalid use of DEF. Syntax: DEF "term" definition')
-        
-        # Extract term and definition text
-        self.term_text = content[:content.find('"')]
-        self.definition_text = content[content.find('"')+1:].lstrip()
+        self.term_text, self.definition_text = split_content
         
         if not self.term_text:
             raise SanimParseError('Empty term in DEF')
@@ -301,9 +343,17 @@ class DefinitionElement(OutputElement):
         self.in_between_time = 0.1
         self.definition_run_time = 0.6 + len(self.definition_text) / 150
     
-    def copy(self):
-        """Create a copy of this element."""
-        return DefinitionElement(self.input_elem)
+    @staticmethod
+    def get_tex_requirements(input_elem):
+        """Get the TeX files this definition will compile."""
+        split_content = split_quoted_term(input_elem.content)
+        if split_content is None:
+            return []
+        term_text, definition_text = split_content
+        result = []
+        for tex_string in ['\\textbf{' + term_text + '}:', definition_text]:
+            result += get_tex_file_requirements(TextMobject, tex_string, alignment="")
+        return result
     
     def individual_play(self, scene):
         """Animate the definition in the scene."""
@@ -334,39 +384,30 @@ class DefinitionElement(OutputElement):
     
     def get_shift_center_at_actions(self, position):
         """Get animations to shift this definition to be centered at the given position."""
-        # Create temporary mobjects for positioning
-        pos_term = TextMobject(self.term_text, alignment="")
-        pos_definition = TextMobject(self.definition_text, alignment="")
-        
-        pos_term.move_to(position)
-        pos_definition.next_to(pos_term, RIGHT)
-        pos_definition.align_to(pos_term, UP)
-        
+        target = self.get_layout_copy()
+        target.position_center_at(position)
         return [
-            ApplyMethod(self.term.move_to, pos_term),
-            ApplyMethod(self.definition.move_to, pos_definition)
+            ApplyMethod(self.term.move_to, target.term),
+            ApplyMethod(self.definition.move_to, target.definition)
         ]
     
     def get_shift_left_aligned_actions(self, position):
         """Get animations to shift this definition to be left-aligned at the given position."""
-        # Create temporary mobjects for positioning
-        pos_term = TextMobject(self.term_text, alignment="")
-        pos_definition = TextMobject(self.definition_text, alignment="")
-        
-        pos_term.move_to(position)
-        pos_term.to_edge(LEFT)
-        pos_definition.next_to(pos_term, RIGHT)
-        pos_definition.align_to(pos_term, UP)
-        
+        target = self.get_layout_copy()
+        target.position_left_aligned(position)
         return [
-            ApplyMethod(self.term.move_to, pos_term),
-            ApplyMethod(self.definition.move_to, pos_definition)
+            ApplyMethod(self.term.move_to, target.term),
+            ApplyMethod(self.definition.move_to, target.definition)
         ]
     
     def get_bottom_position(self):
         """Get the position at the bottom of this definition."""
         return self.definition
     
+    def get_mobjects(self):
+        """Get the mobjects that display this definition."""
+        return [self.term, self.definition]
+    
     def get_fade_out_actions(self):
         """Get animations to fade out this definition."""
         return [FadeOut(self.term), FadeOut(self.definition)]
@@ -386,18 +427,12 @@ class TermElement(OutputElement):
             SanimParseError: If the term syntax is invalid
         """
         super().__init__(input_elem)
-        content = input_elem.content.lstrip()
         
         # Parse term
-        if not content or content[0] != '"':
-            raise SanimParseError('Invalid use of TERM. Syntax: TERM "term"')
-        
-        content = content[1:]
-        if '"' not in content:
+        split_content = split_quoted_term(input_elem.content)
+        if split_content is None:
             raise SanimParseError('Invalid use of TERM. Syntax: TERM "term"')
-        
-        # Extract term text
-        self.term_text = content[:content.find('"')]
+        self.term_text = split_content[0]
         
         if not self.term_text:
             raise SanimParseError('Empty term in TERM')
@@ -413,9 +448,15 @@ class TermElement(OutputElement):
         # Animation timing
         self.term_run_time = 0.5
     
-    def copy(self):
-        """Create a copy of this element."""
-        return TermElement(self.input_elem)
+    @staticmethod
+    def get_tex_requirements(input_elem):
+        """Get the TeX files this term will compile."""
+        split_content = split_quoted_term(input_elem.content)
+        if split_content is None:
+            return []
+        return get_tex_file_requirements(
+            TextMobject, '\\textbf{' + split_content[0] + '}', alignment=""
+        )
     
     def individual_play(self, scene):
         """Animate the term in the scene."""
@@ -444,17 +485,18 @@ class TermElement(OutputElement):
     
     def get_shift_left_aligned_actions(self, position):
         """Get animations to shift this term to be left-aligned at the given position."""
-        # Create a temporary mobject for positioning
-        pos_term = TextMobject(self.term_text, alignment="")
-        pos_term.move_to(position)
-        pos_term.to_edge(LEFT)
-        
-        return [ApplyMethod(self.term.move_to, pos_term)]
+        target = self.get_layout_copy()
+        target.position_left_aligned(position)
+        return [ApplyMethod(self.term.move_to, target.term)]
     
     def get_bottom_position(self):
         """Get the position at the bottom of this term."""
         return self.term
     
+    def get_mobjects(self):
+        """Get the mobjects that display this term."""
+        return [self.term]
+    
     def get_fade_out_actions(self):
         """Get animations to fade out this term."""
         return [FadeOut(self.term)]
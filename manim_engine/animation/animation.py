@@ -90,6 +90,25 @@ class Animation(object):
             return alpha
         raise Exception("Invalid submobject mode")
 
+    def get_sub_alphas(self, alpha, num_submobjects):
+        """
+        Same as get_sub_alpha, for all the submobjects at once
+        """
+        indices = np.arange(num_submobjects)
+        if self.submobject_mode in ["lagged_start", "smoothed_lagged_start"]:
+            props = indices / num_submobjects
+            if self.submobject_mode == "smoothed_lagged_start":
+                props = np.array([smooth(prop) for prop in props])
+            lf = self.lag_factor
+            return np.clip(lf * alpha - (lf - 1) * props, 0, 1)
+        elif self.submobject_mode == "one_at_a_time":
+            lower = indices / num_submobjects
+            upper = (indices + 1) / num_submobjects
+            return np.clip((alpha - lower) / (upper - lower), 0, 1)
+        elif self.submobject_mode == "all_at_once":
+            return np.full(num_submobjects, alpha)
+        raise Exception("Invalid submobject mode")
+
     def filter_out(self, *filter_functions):
         self.filter_functions += filter_functions
         return self
@@ -7,6 +7,7 @@ from manim_engine.animation.animation import Animation
 from manim_engine.mobject.svg.tex_mobject import TextMobject
 from manim_engine.mobject.types.vectorized_mobject import VMobject
 from manim_engine.mobject.types.vectorized_mobject import VectorizedPoint
+from manim_engine.mobject.types.vectorized_mobject import pointwise_become_partials
 from manim_engine.animation.transform import Transform
 from manim_engine.utils.bezier import interpolate
 from manim_engine.utils.config_ops import digest_config
@@ -55,19 +56,119 @@ class DrawBorderThenFill(Animation):
         if not isinstance(vmobject, VMobject):
             raise Exception("DrawBorderThenFill only works for VMobjects")
         self.reached_halfway_point_before = False
+        self.batch_style = None
+        self.last_sub_alphas = None
         Animation.__init__(self, vmobject, **kwargs)
 
+    def update_mobject(self, alpha):
+        """
+        Does what update_submobject would do for each submobject, but
+        leaves alone the ones whose alpha did not change since the last
+        update, draws the borders of the others together, and sets their
+        style directly in their rgbas arrays, from values looked up once.
+        """
+        if self.batch_style is None:
+            self.batch_style = self.get_batch_style()
+        if self.batch_style is False:
+            return Animation.update_mobject(self, alpha)
+        stroke_rgbs, end_widths, end_opacities, nested = self.batch_style
+        families = self.all_families_zipped
+        sub_alphas = self.get_sub_alphas(alpha, len(families))
+        if nested and np.any(np.diff(sub_alphas) > 0):
+            # A submobject would be ahead of one containing it, whose
+            # set_stroke and set_fill would leave their style on it
+            self.batch_style = False
+            return Animation.update_mobject(self, alpha)
+        if self.last_sub_alphas is None:
+            changed = np.arange(len(families))
+        else:
+            changed = np.flatnonzero(sub_alphas != self.last_sub_alphas)
+        self.last_sub_alphas = sub_alphas
+        fill_alphas = 2 * sub_alphas - 1
+        widths = interpolate(self.stroke_width, end_widths, fill_alphas)
+        opacities = interpolate(0, end_opacities, fill_alphas)
+        upper_alphas = np.minimum(2 * sub_alphas, 1)
+        partial_indices = []
+        for i in changed:
+            submobject, starting_submobject = families[i]
+            if type(submobject).pointwise_become_partial is VMobject.pointwise_become_partial:
+                partial_indices.append(i)
+            else:
+                submobject.pointwise_become_partial(
+                    starting_submobject, 0, upper_alphas[i]
+                )
+        pointwise_become_partials(
+            [families[i][0] for i in partial_indices],
+            [families[i][1] for i in partial_indices],
+            np.zeros(len(partial_indices)),
+            upper_alphas[partial_indices]
+        )
+        for i in changed:
+            submobject, starting_submobject = families[i]
+            sub_alpha = sub_alphas[i]
+            if sub_alpha < 0.5:
+                submobject.stroke_rgbas[:, :3] = stroke_rgbs[i]
+                submobject.stroke_width = self.stroke_width
+                submobject.fill_rgbas[:, 3] = 0
+            else:
+                if not self.reached_halfway_point_before:
+                    self.reached_halfway_point_before = True
+                    submobject.points = np.array(starting_submobject.points)
+                submobject.stroke_width = widths[i]
+                submobject.fill_rgbas[:, 3] = opacities[i]
+        return self
+
+    def get_batch_style(self):
+        """
+        Returns the stroke color used while drawing the border, and the
+        final stroke width and fill opacity, of each submobject, and
+        whether some contain others.  Returns False if update_mobject has
+        to update them one by one, because update_submobject was
+        overridden, or some submobject has a gradient, or contains one
+        that does not come after it.
+        """
+        if type(self).update_submobject is not DrawBorderThenFill.update_submobject:
+            return False
+        families = self.all_families_zipped
+        indices = dict(
+            (id(submobject), i)
+            for i, (submobject, starting_submobject) in enumerate(families)
+        )
+        nested = False
+        stroke_rgbs = []
+        end_widths = []
+        end_opacities = []
+        for i, (submobject, starting_submobject) in enumerate(families):
+            for descendant in submobject.submobject_family()[1:]:
+                if indices.get(id(descendant), -1) <= i:
+                    return False
+                nested = True
+            if not hasattr(submobject, "stroke_rgbas") or not hasattr(submobject, "fill_rgbas"):
+                return False
+            stroke_rgbas = submobject.generate_rgbas_array(
+                self.get_border_color(starting_submobject), 0
+            )
+            if len(stroke_rgbas) != 1:
+                return False
+            stroke_rgbs.append(stroke_rgbas[0, :3])
+            end_widths.append(starting_submobject.get_stroke_width())
+            end_opacities.append(starting_submobject.get_fill_opacity())
+        return stroke_rgbs, np.array(end_widths), np.array(end_opacities), nested
+
+    def get_border_color(self, starting_submobject):
+        if self.stroke_color:
+            return self.stroke_color
+        elif starting_submobject.stroke_width > 0:
+            return starting_submobject.get_stroke_color()
+        else:
+            return starting_submobject.get_color()
+
     def update_submobject(self, submobject, starting_submobject, alpha):
         submobject.pointwise_become_partial(
             starting_submobject, 0, min(2 * alpha, 1)
         )
         if alpha < 0.5:
-            if self.stroke_color:
-                color = self.stroke_color
-            elif starting_submobject.stroke_width > 0:
-                color = starting_submobject.get_stroke_color()
-            else:
-                color = starting_submobject.get_color()
+            color = self.get_border_color(starting_submobject)
             submobject.set_stroke(color, width=self.stroke_width)
             submobject.set_fill(opacity=0)
         else:
@@ -181,6 +181,7 @@ class WiggleOutThenIn(Animation):
 
     def update_submobject(self, submobject, starting_sumobject, alpha):
         submobject.points[:, :] = starting_sumobject.points
+        submobject.note_geometry_change()
         submobject.scale(
             interpolate(1, self.scale_value, there_and_back(alpha)),
             about_point=self.scale_about_point
@@ -7,10 +7,10 @@ import copy
 # import aggdraw
 import copy
 import time
+from collections import OrderedDict
 
 from PIL import Image
 from colour import Color
-from scipy.spatial.distance import pdist
 import cairo
 
 from manim_engine.constants import *
@@ -54,12 +54,36 @@ class Camera(object):
         # round z coordinate to nearest hundredth when comparring
         "z_buff_func": lambda m: np.round(m.get_center()[2], 2),
         "cairo_line_width_multiple": 0.01,
+        # Whether Scene.play may redraw only the region of the frame
+        # covered by the moving mobjects.  Cameras which draw anything
+        # outside of the pixel bounding box of the points they're given
+        # should turn this off.
+        "use_dirty_rectangles": True,
+        # Cairo's default, strokes can stick out this many half widths
+        # at sharp corners
+        "cairo_miter_limit": 10,
+        # Cairo paths of this many vmobjects are kept, and reused
+        # while their points don't change.  Cameras whose view of
+        # the points can change should set this to 0.
+        "max_cached_cairo_paths": 1000,
+        # Vmobjects drawn again after only being moved, or faded when
+        # they have a single visible layer, are blitted
+        # from sprites.  This caps the memory of those sprites; cameras
+        # whose view of the points can change should set it to 0.
+        "max_sprite_cache_bytes": 2**27,
+        # Memory for resized and rotated copies of images
+        "max_image_sprite_cache_bytes": 2**27,
     }
 
     def __init__(self, background=None, **kwargs):
         digest_config(self, kwargs, locals())
         self.rgb_max_val = np.iinfo(self.pixel_array_dtype).max
         self.pixel_array_to_cairo_context = {}
+        self.cairo_path_cache = OrderedDict()
+        self.sprite_cache = OrderedDict()
+        self.sprite_cache_bytes = 0
+        self.image_sprite_cache = OrderedDict()
+        self.image_sprite_cache_bytes = 0
         self.init_background()
         self.resize_frame_shape()
         self.reset()
@@ -275,6 +299,64 @@ class Camera(object):
                 if batch_type == mobject_type:
                     func(batch, self.pixel_array)
 
+    def get_pixel_bounding_box(self, mobjects):
+        """
+        Returns (left, top, right, bottom) pixel bounds, right and
+        bottom exclusive, of everything capture_mobjects would draw
+        for these mobjects, clipped to the frame.  None if empty.
+        """
+        mobjects = self.get_mobjects_to_display(mobjects)
+        if len(mobjects) == 0:
+            return None
+        all_points = []
+        buff = 0
+        for mobject in mobjects:
+            points = mobject.points
+            if isinstance(mobject, AbstractImageMobject):
+                # Points are only three of the four corners
+                points = np.append(points, [points[1] + points[2] - points[0]], axis=0)
+            buff = max(buff, self.get_pixel_buff(mobject))
+            all_points.append(points)
+        all_points = np.concatenate(all_points)
+        if len(all_points) == 0:
+            return None
+        pixel_coords = self.points_to_pixel_coords(all_points)
+        left, top = np.maximum(pixel_coords.min(0) - buff, 0)
+        right, bottom = np.minimum(
+            pixel_coords.max(0) + buff + 1,
+            [self.get_pixel_width(), self.get_pixel_height()],
+        )
+        if left >= right or top >= bottom:
+            return None
+        return (int(left), int(top), int(right), int(bottom))
+
+    def get_pixel_buff(self, mobject):
+        """
+        Returns how many pixels past its points mobject can be drawn.
+        """
+        # Room for anti-aliasing
+        buff = 2
+        if isinstance(mobject, VMobject):
+            width = max(
+                mobject.get_stroke_width(),
+                mobject.get_stroke_width(background=True),
+            )
+            pixels_per_unit = fdiv(self.get_pixel_width(), self.get_frame_width())
+            stroke_buff = pixels_per_unit * self.cairo_line_width_multiple * \
+                width * self.cairo_miter_limit / 2
+            buff = int(np.ceil(stroke_buff)) + 2
+        elif isinstance(mobject, PMobject):
+            buff = int(self.adjusted_thickness(mobject.stroke_width)) + 2
+        return buff
+
+    def set_pixel_array_region(self, pixel_array, region):
+        """
+        Copies the (left, top, right, bottom) region of
+        pixel_array into the camera's pixel array.
+        """
+        left, top, right, bottom = region
+        self.pixel_array[top:bottom, left:right] = pixel_array[top:bottom, left:right]
+
     # Methods associated with svg rendering
 
     def get_cached_cairo_context(self, pixel_array):
@@ -333,25 +415,234 @@ class Camera(object):
             # Subpath vectorized mobjects are taken care
             # of by their parent
             return
+        if self.max_sprite_cache_bytes > 0 and \
+                self.display_vectorized_from_sprite(vmobject, ctx):
+            return self
         self.set_cairo_context_path(ctx, vmobject)
         self.apply_stroke(ctx, vmobject, background=True)
         self.apply_fill(ctx, vmobject)
         self.apply_stroke(ctx, vmobject)
         return self
 
+    def display_vectorized_from_sprite(self, vmobject, ctx):
+        """
+        Blits vmobject from a sprite if, since it was last drawn
+        differently, it has only been translated, or faded with a
+        single visible layer.  Otherwise remembers how it looks now,
+        for next time.  Returns whether it was blitted.
+        """
+        vmobs = [vmobject] + vmobject.get_subpath_mobjects()
+        points = np.concatenate([vmob.points for vmob in vmobs])
+        if len(points) == 0:
+            return False
+        lengths = [len(vmob.points) for vmob in vmobs]
+        # Background stroke, fill and stroke, as drawn by display_vectorized
+        widths = [
+            vmobject.get_stroke_width(background=True),
+            None,
+            vmobject.get_stroke_width(),
+        ]
+        layers = [
+            np.array(self.get_stroke_rgbas(vmobject, background=True)),
+            np.array(self.get_fill_rgbas(vmobject)),
+            np.array(self.get_stroke_rgbas(vmobject)),
+        ]
+        layers = [rgbas for rgbas, width in zip(layers, widths) if width != 0]
+        m = ctx.get_matrix()
+        matrix = (m.xx, m.yx, m.xy, m.yy, m.x0, m.y0)
+
+        key = id(vmobject)
+        entry = self.sprite_cache.get(key)
+        alpha = None
+        if entry is not None:
+            alpha = self.get_sprite_alpha(entry, points, lengths, widths, layers, matrix)
+        if alpha is not None:
+            # Where the first point was drawn when the entry was made,
+            # and where it goes now, in pixels
+            x0, y0 = cairo.Matrix(*entry["matrix"]).transform_point(*entry["points"][0, :2])
+            x1, y1 = ctx.get_matrix().transform_point(*points[0, :2])
+            shift = np.array([x1 - x0, y1 - y0])
+            if np.allclose(shift, np.round(shift), rtol=0, atol=1e-6):
+                shift = np.round(shift)
+            elif np.array_equal(shift, entry["shift"]):
+                # Sprites blitted between pixels are resampled, which
+                # blurs them slightly, so vmobjects that stopped there
+                # are drawn again and remembered as they are now
+                alpha = None
+        if alpha is None:
+            self.remove_sprite_cache_entry(key)
+            entry = {
+                "points": points,
+                "lengths": lengths,
+                "widths": widths,
+                "layers": layers,
+                "matrix": matrix,
+                "shift": np.zeros(2),
+                "sprite": None,
+                "nbytes": points.nbytes,
+            }
+            self.add_sprite_cache_entry(key, entry)
+            return False
+        self.sprite_cache.move_to_end(key)
+        entry["shift"] = shift
+
+        if entry["sprite"] is None:
+            if alpha != 1:
+                # Sprites are only rasterized from the original colors
+                return False
+            sprite = self.rasterize_sprite(vmobject, entry, ctx, shift)
+            entry["sprite"] = sprite
+            entry["nbytes"] += sprite[0].get_stride() * sprite[0].get_height()
+            self.sprite_cache_bytes += sprite[0].get_stride() * sprite[0].get_height()
+            self.trim_sprite_cache()
+        surface, left, top = entry["sprite"]
+        ctx.save()
+        ctx.identity_matrix()
+        ctx.set_source_surface(surface, left + shift[0], top + shift[1])
+        # Same pixels as drawing it when moved by whole pixels
+        ctx.get_source().set_filter(cairo.FILTER_BILINEAR)
+        if alpha == 1:
+            ctx.paint()
+        else:
+            ctx.paint_with_alpha(alpha)
+        ctx.restore()
+        return True
+
+    def clear_sprite_cache(self):
+        """
+        Forgets all sprites, so that what is drawn from now on doesn't
+        depend on what was drawn before.
+        """
+        self.sprite_cache.clear()
+        self.sprite_cache_bytes = 0
+
+    def get_sprite_alpha(self, entry, points, lengths, widths, layers, matrix):
+        """
+        Returns the opacity at which entry's sprites reproduce a
+        vmobject with this geometry and style, or None if they can't.
+        """
+        if entry["lengths"] != lengths or entry["widths"] != widths:
+            return None
+        # Only translations of the pixel grid are allowed
+        if entry["matrix"][:4] != matrix[:4]:
+            return None
+        ref_points = entry["points"]
+        shift = points[0] - ref_points[0]
+        if not np.allclose(points - ref_points, shift, rtol=0, atol=1e-6):
+            return None
+        ref_layers = entry["layers"]
+        if len(ref_layers) != len(layers):
+            return None
+        if all(
+            ref_rgbas.shape == rgbas.shape and np.array_equal(ref_rgbas, rgbas)
+            for ref_rgbas, rgbas in zip(ref_layers, layers)
+        ):
+            return 1
+        # Scaling the opacity of a whole sprite only matches scaling
+        # that of its layers if one layer is visible
+        visible = [i for i, rgbas in enumerate(ref_layers) if rgbas[:, 3].any()]
+        if len(visible) != 1:
+            return None
+        alpha = None
+        for i, (ref_rgbas, rgbas) in enumerate(zip(ref_layers, layers)):
+            if ref_rgbas.shape != rgbas.shape:
+                return None
+            if i != visible[0]:
+                if rgbas[:, 3].any():
+                    return None
+                continue
+            if not np.array_equal(ref_rgbas[:, :3], rgbas[:, :3]):
+                return None
+            ref_alphas = ref_rgbas[:, 3]
+            alphas = rgbas[:, 3]
+            if alphas[ref_alphas == 0].any():
+                return None
+            ratios = alphas[ref_alphas > 0] / ref_alphas[ref_alphas > 0]
+            alpha = ratios[0]
+            if not 0 <= alpha <= 1 or not np.allclose(ratios, alpha, rtol=0, atol=1e-6):
+                return None
+        return alpha
+
+    def rasterize_sprite(self, vmobject, entry, ctx, shift):
+        """
+        Draws vmobject, which is entry's vmobject translated by shift
+        pixels, into a new sprite holding entry's vmobject.  Returns
+        the sprite's surface, and the pixel position at which it
+        reproduces entry's vmobject.
+        """
+        matrix = cairo.Matrix(*entry["matrix"])
+        ref_points = entry["points"][:, :2]
+        corners = [
+            matrix.transform_point(x, y)
+            for x in (ref_points[:, 0].min(), ref_points[:, 0].max())
+            for y in (ref_points[:, 1].min(), ref_points[:, 1].max())
+        ]
+        buff = self.get_pixel_buff(vmobject)
+        left, top = np.floor(np.min(corners, 0)).astype(int) - buff
+        right, bottom = np.ceil(np.max(corners, 0)).astype(int) + buff + 1
+        surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, int(right - left), int(bottom - top))
+        sprite_ctx = cairo.Context(surface)
+        sprite_ctx.set_matrix(ctx.get_matrix().multiply(cairo.Matrix(
+            x0=-left - shift[0],
+            y0=-top - shift[1],
+        )))
+        self.set_cairo_context_path(sprite_ctx, vmobject)
+        self.apply_stroke(sprite_ctx, vmobject, background=True)
+        self.apply_fill(sprite_ctx, vmobject)
+        self.apply_stroke(sprite_ctx, vmobject)
+        surface.flush()
+        return (surface, int(left), int(top))
+
+    def add_sprite_cache_entry(self, key, entry):
+        self.sprite_cache[key] = entry
+        self.sprite_cache_bytes += entry["nbytes"]
+        self.trim_sprite_cache()
+
+    def remove_sprite_cache_entry(self, key):
+        entry = self.sprite_cache.pop(key, None)
+        if entry is not None:
+            self.sprite_cache_bytes -= entry["nbytes"]
+
+    def trim_sprite_cache(self):
+        while self.sprite_cache_bytes > self.max_sprite_cache_bytes and self.sprite_cache:
+            key, entry = self.sprite_cache.popitem(last=False)
+            self.sprite_cache_bytes -= entry["nbytes"]
+
     def set_cairo_context_path(self, ctx, vmobject):
         ctx.new_path()
-        for vmob in it.chain([vmobject], vmobject.get_subpath_mobjects()):
+        vmobs = [vmobject] + vmobject.get_subpath_mobjects()
+        if self.max_cached_cairo_paths == 0:
+            self.build_cairo_context_path(ctx, vmobs)
+            return self
+        key = id(vmobject)
+        all_points = np.concatenate([vmob.points for vmob in vmobs])
+        lengths = [len(vmob.points) for vmob in vmobs]
+        cached = self.cairo_path_cache.get(key)
+        if cached is not None and cached[1] == lengths and \
+                np.array_equal(cached[0], all_points):
+            self.cairo_path_cache.move_to_end(key)
+            ctx.append_path(cached[2])
+            return self
+        self.build_cairo_context_path(ctx, vmobs)
+        self.cairo_path_cache[key] = (all_points, lengths, ctx.copy_path())
+        if len(self.cairo_path_cache) > self.max_cached_cairo_paths:
+            self.cairo_path_cache.popitem(last=False)
+        return self
+
+    def build_cairo_context_path(self, ctx, vmobs):
+        for vmob in vmobs:
             points = self.transform_points_pre_display(vmob.points)
+            n_curves = (len(points) - 1) // 3
+            # Plain floats are much faster to hand to cairo
+            # than numpy scalars
+            start = points[0, :2].tolist()
+            curves = points[1:3 * n_curves + 1, :2].reshape((n_curves, 6)).tolist()
             ctx.new_sub_path()
-            ctx.move_to(*points[0][:2])
-            for triplet in zip(points[1::3], points[2::3], points[3::3]):
-                ctx.curve_to(*it.chain(*[
-                    point[:2] for point in triplet
-                ]))
+            ctx.move_to(*start)
+            for curve in curves:
+                ctx.curve_to(*curve)
             if vmob.is_closed():
                 ctx.close_path()
-        return self
 
     def set_cairo_context_color(self, ctx, rgbas, vmobject):
         if len(rgbas) == 1:
@@ -468,61 +759,101 @@ class Camera(object):
         down_vect = dl_coords - ul_coords
         center_coords = ul_coords + (right_vect + down_vect) / 2
 
-        sub_image = Image.fromarray(
-            image_mobject.get_pixel_array(),
-            mode="RGBA"
-        )
-
-        # Reshape
-        pixel_width = max(int(pdist([ul_coords, ur_coords])), 1)
-        pixel_height = max(int(pdist([ul_coords, dl_coords])), 1)
-        sub_image = sub_image.resize(
-            (pixel_width, pixel_height), resample=Image.BICUBIC
-        )
-
-        # Rotate
+        pixel_width = max(int(get_norm(ur_coords - ul_coords)), 1)
+        pixel_height = max(int(get_norm(dl_coords - ul_coords)), 1)
         angle = angle_of_vector(right_vect)
         adjusted_angle = -int(360 * angle / TAU)
-        if adjusted_angle != 0:
-            sub_image = sub_image.rotate(
-                adjusted_angle, resample=Image.BICUBIC, expand=1
-            )
+        sprite = self.get_image_sprite(
+            image_mobject,
+            (pixel_width, pixel_height),
+            adjusted_angle,
+        )
 
         # TODO, there is no accounting for a shear...
 
-        # Paste into an image as large as the camear's pixel array
-        full_image = Image.fromarray(
-            np.zeros((self.get_pixel_height(), self.get_pixel_width())),
-            mode="RGBA"
-        )
-        new_ul_coords = center_coords - np.array(sub_image.size) / 2
+        new_ul_coords = center_coords - np.array(sprite.shape[1::-1]) / 2
         new_ul_coords = new_ul_coords.astype(int)
-        full_image.paste(
-            sub_image,
-            box=(
-                new_ul_coords[0],
-                new_ul_coords[1],
-                new_ul_coords[0] + sub_image.size[0],
-                new_ul_coords[1] + sub_image.size[1],
-            )
-        )
         # Paint on top of existing pixel array
-        self.overlay_PIL_image(pixel_array, full_image)
+        self.overlay_rgba_array(pixel_array, sprite, *new_ul_coords)
 
-    def overlay_rgba_array(self, pixel_array, new_array):
-        self.overlay_PIL_image(
-            pixel_array,
-            self.get_image(new_array),
-        )
+    def get_image_sprite(self, image_mobject, size, angle):
+        """
+        Returns the pixels of image_mobject resized to size and rotated
+        by angle degrees, as an RGBA array.  Results are cached by the
+        version of the pixels, which copies share, and faded images
+        scale the alpha of the cached sprite of the image they fade.
+        Images that can't tell when their pixels change are resized
+        every time.
+        """
+        source, opacity = image_mobject.get_pixel_source()
+        version = source.get_pixel_version()
+        if version is None:
+            return self.resize_image_array(
+                image_mobject.get_pixel_array(), size, angle
+            )
+        key = (version, size, angle)
+        sprite = self.image_sprite_cache.get(key)
+        if sprite is not None:
+            self.image_sprite_cache.move_to_end(key)
+        else:
+            sprite = self.resize_image_array(source.get_pixel_array(), size, angle)
+            if sprite.nbytes <= self.max_image_sprite_cache_bytes:
+                self.image_sprite_cache[key] = sprite
+                self.image_sprite_cache_bytes += sprite.nbytes
+                while self.image_sprite_cache_bytes > self.max_image_sprite_cache_bytes:
+                    old_key, old_sprite = self.image_sprite_cache.popitem(last=False)
+                    self.image_sprite_cache_bytes -= old_sprite.nbytes
+        if opacity != 1:
+            sprite = np.array(sprite)
+            sprite[:, :, 3] = sprite[:, :, 3] * opacity + 0.5
+        return sprite
+
+    def resize_image_array(self, image_array, size, angle):
+        sub_image = Image.fromarray(image_array, mode="RGBA")
+
+        # Reshape
+        sub_image = sub_image.resize(size, resample=Image.BICUBIC)
+
+        # Rotate
+        if angle != 0:
+            sub_image = sub_image.rotate(
+                angle, resample=Image.BICUBIC, expand=1
+            )
+        return np.array(sub_image)
+
+    def overlay_rgba_array(self, pixel_array, new_array, left=0, top=0):
+        """
+        Alpha composites new_array on top of pixel_array in place,
+        with its upper left corner at pixel (left, top).  Gives the
+        same result as PIL's Image.alpha_composite, but only touches
+        the pixels new_array covers.
+        """
+        height, width = pixel_array.shape[:2]
+        x0, y0 = max(left, 0), max(top, 0)
+        x1 = min(left + new_array.shape[1], width)
+        y1 = min(top + new_array.shape[0], height)
+        if x0 >= x1 or y0 >= y1:
+            return
+        dst = pixel_array[y0:y1, x0:x1]
+        src = new_array[y0 - top:y1 - top, x0 - left:x1 - left]
+        # Same integer arithmetic as PIL's ImagingAlphaComposite
+        src_a = src[:, :, 3:].astype(np.uint32)
+        dst_a = dst[:, :, 3:].astype(np.uint32)
+        blend = dst_a * (255 - src_a)
+        out_a_255 = src_a * 255 + blend
+        precision = 1 << 7
+        coef1 = src_a * (255 * 255 * precision) // np.maximum(out_a_255, 1)
+        coef2 = 255 * precision - coef1
+        rgb = src[:, :, :3] * coef1 + dst[:, :, :3] * coef2 + (0x80 * precision)
+        rgb = (((rgb >> 8) + rgb) >> 8) // precision
+        out_a = out_a_255 + 0x80
+        out_a = ((out_a >> 8) + out_a) >> 8
+        covered = src_a[:, :, 0] > 0
+        dst[covered, :3] = rgb[covered]
+        dst[covered, 3:] = out_a[covered]
 
     def overlay_PIL_image(self, pixel_array, image):
-        pixel_array[:, :] = np.array(
-            Image.alpha_composite(
-                self.get_image(pixel_array),
-                image
-            ),
-            dtype='uint8'
-        )
+        self.overlay_rgba_array(pixel_array, np.asarray(image.convert("RGBA")))
 
     def adjust_out_of_range_points(self, points):
         if not np.any(points > self.max_allowable_norm):
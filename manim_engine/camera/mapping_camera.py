@@ -15,7 +15,10 @@ class MappingCamera(Camera):
     CONFIG = {
         "mapping_func": lambda p: p,
         "min_anchor_points": 50,
-        "allow_object_intrusion": False
+        "allow_object_intrusion": False,
+        "use_dirty_rectangles": False,
+        "max_cached_cairo_paths": 0,
+        "max_sprite_cache_bytes": 0,
     }
 
     def points_to_pixel_coords(self, points):
@@ -46,6 +49,10 @@ class MappingCamera(Camera):
 # TODO, the classes below should likely be deleted
 
 class OldMultiCamera(Camera):
+    CONFIG = {
+        "use_dirty_rectangles": False,
+    }
+
     def __init__(self, *cameras_with_start_positions, **kwargs):
         self.shifted_cameras = [
             DictAsObject(
@@ -32,6 +32,7 @@ class MovingCamera(Camera):
         "fixed_dimension": 0,  # width
         "default_frame_stroke_color": WHITE,
         "default_frame_stroke_width": 0,
+        "use_dirty_rectangles": False,
     }
 
     def __init__(self, frame=None, **kwargs):
@@ -24,6 +24,9 @@ class ThreeDCamera(Camera):
         "light_source_start_point": 9 * DOWN + 7 * LEFT + 10 * OUT,
         "frame_center": ORIGIN,
         "should_apply_shading": True,
+        "use_dirty_rectangles": False,
+        "max_cached_cairo_paths": 0,
+        "max_sprite_cache_bytes": 0,
     }
 
     def __init__(self, *args, **kwargs):
@@ -1,13 +1,6 @@
 import os
 import numpy as np
 
-#this file acts as a flag to differenciate between manim and sanim mode
-#if the -x option is not present, the file will be empty, and manim works as usual.
-#otherwise: 1) -x should be followed by a sanim source file, 2) the file will be written
-#into this document, 3) we are in sanim mode, 4) all the sanim-related files will
-#appear in the same folder as the sanim source file
-SANIM_AUX_FILE = 'manim_engine'+os.sep+'sanim_flag_AUTOGENERATED.txt'
-
 #html for the web presentation of sanim (in the main manim dir)
 SANIM_HTML_FILE = "sanim_interactive.html"
 
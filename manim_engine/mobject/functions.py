@@ -22,6 +22,7 @@ class ParametricFunction(VMobject):
         self.points[:, 0] = np.linspace(
             self.t_min, self.t_max, n_points
         )
+        self.note_geometry_change()
         # VMobject.apply_function takes care of preserving
         # desirable tangent line properties at anchor points
         self.apply_function(lambda p: self.function(p[0]))
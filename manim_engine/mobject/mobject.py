@@ -5,6 +5,7 @@ import numpy as np
 import operator as op
 import os
 import random
+import weakref
 
 from colour import Color
 
@@ -38,6 +39,17 @@ class Mobject(Container):
         "dim": 3,
         "target": None,
     }
+    # Incremented whenever the points or the submobjects of any
+    # mobject change, see get_family_bounding_box
+    geometry_version_counter = 0
+    # Value of the counter when the geometry of this mobject's
+    # family last changed
+    family_geometry_version = 0
+    bounding_box_cache = None
+    # Mobjects each mobject was a submobject of when they last
+    # computed their bounding box.  It is kept out of the mobjects
+    # themselves so that copies don't share or duplicate it.
+    parents = weakref.WeakKeyDictionary()
 
     def __init__(self, *submobjects, **kwargs):
         Container.__init__(self, *submobjects, **kwargs)
@@ -55,6 +67,39 @@ class Mobject(Container):
     def __str__(self):
         return str(self.name)
 
+    @property
+    def points(self):
+        return self._points
+
+    @points.setter
+    def points(self, points):
+        self._points = points
+        self.note_geometry_change()
+
+    @property
+    def submobjects(self):
+        return self._submobjects
+
+    @submobjects.setter
+    def submobjects(self, submobjects):
+        self._submobjects = submobjects
+        self.note_geometry_change()
+
+    def note_geometry_change(self):
+        """
+        Invalidates cached bounding boxes. Assigning points or submobjects
+        does this already, it only needs to be called after changing them
+        in place, e.g. with mob.points[0] = point.
+        """
+        Mobject.geometry_version_counter += 1
+        version = Mobject.geometry_version_counter
+        to_visit = [self]
+        while to_visit:
+            mob = to_visit.pop()
+            if mob.family_geometry_version != version:
+                mob.family_geometry_version = version
+                to_visit.extend(Mobject.parents.get(mob, ()))
+
     def reset_points(self):
         self.points = np.zeros((0, self.dim))
 
@@ -81,6 +126,7 @@ class Mobject(Container):
         for mobject in mobjects:
             if mobject in self.submobjects:
                 self.submobjects.remove(mobject)
+                self.note_geometry_change()
         return self
 
     def get_array_attrs(self):
@@ -676,6 +722,34 @@ class Mobject(Container):
         values = points_func(points[:, dim])
         return reduce_func(values)
 
+    def get_family_bounding_box(self):
+        """
+        Returns the minimum and maximum corners of the points of the
+        whole family, or None if it has no points. It is cached until
+        the points or the submobjects of the family change, which
+        note_geometry_change reports to every ancestor that has
+        computed its bounding box.
+        """
+        cache = self.bounding_box_cache
+        # Copies start with the cache of their original, but with
+        # no parents recorded for their submobjects
+        if cache is not None and cache[0] == id(self) and \
+                cache[1] == self.family_geometry_version:
+            return cache[2]
+        family = self.submobject_family()
+        for mob in family:
+            for submob in mob.submobjects:
+                Mobject.parents.setdefault(submob, weakref.WeakSet()).add(mob)
+        points = self.get_all_points()
+        if len(points) == 0:
+            bounding_box = None
+        else:
+            bounding_box = (points.min(0), points.max(0))
+        self.bounding_box_cache = (
+            id(self), self.family_geometry_version, bounding_box
+        )
+        return bounding_box
+
     def nonempty_submobjects(self):
         return [
             submob for submob in self.submobjects
@@ -683,14 +757,14 @@ class Mobject(Container):
         ]
 
     def get_merged_array(self, array_attr):
-        result = getattr(self, array_attr)
-        for submob in self.submobjects:
-            result = np.append(
-                result, submob.get_merged_array(array_attr),
-                axis=0
-            )
-            submob.get_merged_array(array_attr)
-        return result
+        # Gather the arrays depth first, then copy them all at once
+        arrays = []
+        to_visit = [self]
+        while to_visit:
+            mob = to_visit.pop()
+            arrays.append(getattr(mob, array_attr))
+            to_visit.extend(reversed(mob.submobjects))
+        return np.concatenate(arrays, axis=0)
 
     def get_all_points(self):
         return self.get_merged_array("points")
@@ -705,19 +779,18 @@ class Mobject(Container):
 
     def get_critical_point(self, direction):
         result = np.zeros(self.dim)
-        all_points = self.get_all_points()
+        bounding_box = self.get_family_bounding_box()
+        if bounding_box is None:
+            # Same default as reduce_across_dimension
+            return result
+        min_vals, max_vals = bounding_box
         for dim in range(self.dim):
-            if direction[dim] <= 0:
-                min_val = min(all_points[:, dim])
-            if direction[dim] >= 0:
-                max_val = max(all_points[:, dim])
-
             if direction[dim] == 0:
-                result[dim] = (max_val + min_val) / 2
+                result[dim] = (max_vals[dim] + min_vals[dim]) / 2
             elif direction[dim] < 0:
-                result[dim] = min_val
+                result[dim] = min_vals[dim]
             else:
-                result[dim] = max_val
+                result[dim] = max_vals[dim]
         return result
 
     # Pseudonyms for more general get_critical_point method
@@ -757,10 +830,11 @@ class Mobject(Container):
         return self.get_edge_center(IN)
 
     def length_over_dim(self, dim):
-        return (
-            self.reduce_across_dimension(np.max, np.max, dim) -
-            self.reduce_across_dimension(np.min, np.min, dim)
-        )
+        bounding_box = self.get_family_bounding_box()
+        if bounding_box is None:
+            return 0
+        min_vals, max_vals = bounding_box
+        return max_vals[dim] - min_vals[dim]
 
     def get_width(self):
         return self.length_over_dim(0)
@@ -110,6 +110,7 @@ class BraceLabel(VMobject):
         self.brace = Brace(obj, self.brace_direction, **kwargs)
         self.brace.put_at_tip(self.label)
         self.submobjects[0] = self.brace
+        self.note_geometry_change()
         return self
 
     def change_label(self, *text, **kwargs):
@@ -119,6 +120,7 @@ class BraceLabel(VMobject):
 
         self.brace.put_at_tip(self.label)
         self.submobjects[1] = self.label
+        self.note_geometry_change()
         return self
 
     def change_brace_label(self, obj, *text):
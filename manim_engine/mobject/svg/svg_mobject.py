@@ -277,6 +277,11 @@ class SVGMobject(VMobject):
             self.set_width(self.width)
 
 
+# Points of each path string parsed so far, along with the points of its
+# subpaths.  Glyphs repeat a lot, so each distinct one is parsed only once.
+PATH_STRING_TO_POINTS = dict()
+
+
 class VMobjectFromSVGPathstring(VMobject):
     def __init__(self, path_string, **kwargs):
         digest_locals(self)
@@ -299,6 +304,20 @@ class VMobjectFromSVGPathstring(VMobject):
         return result
 
     def generate_points(self):
+        if self.path_string in PATH_STRING_TO_POINTS:
+            points, subpath_points_list = PATH_STRING_TO_POINTS[self.path_string]
+            # Mobjects are modified in place, so never share the arrays
+            self.set_points(points.copy())
+            for subpath_points in subpath_points_list:
+                self.add_subpath(subpath_points.copy())
+            return
+        self.parse_path_string()
+        PATH_STRING_TO_POINTS[self.path_string] = (
+            self.points.copy(),
+            [sm.points.copy() for sm in self.get_subpath_mobjects()],
+        )
+
+    def parse_path_string(self):
         pattern = "[%s]" % ("".join(self.get_path_commands()))
         pairs = list(zip(
             re.findall(pattern, self.path_string),
@@ -9,11 +9,26 @@ from manim_engine.utils.tex_file_writing import tex_to_svg_file
 from manim_engine.mobject.geometry import Line
 from manim_engine.mobject.types.vectorized_mobject import VGroup
 from manim_engine.mobject.types.vectorized_mobject import VectorizedPoint
+from manim_engine.mobject.types.vectorized_mobject import VMobject
 
 import operator as op
 from functools import reduce
 
 TEX_MOB_SCALE_FACTOR = 0.03
+# Bump whenever the svg to points conversion changes, so that
+# stale geometry caches get regenerated
+TEX_GEOMETRY_CACHE_VERSION = 1
+
+
+def get_tex_file_requirements(mobject_class, *args, **kwargs):
+    """
+    Returns the (expression, template_tex_file_body) pairs that
+    mobject_class(*args, **kwargs) would compile, without compiling
+    them, so they can be warmed up ahead of time with tex_to_svg_files.
+    """
+    mobject = mobject_class.__new__(mobject_class)
+    digest_config(mobject, kwargs)
+    return mobject.get_tex_file_requirements(*args)
 
 
 class TexSymbol(VMobjectFromSVGPathstring):
@@ -51,6 +66,91 @@ class SingleStringTexMobject(SVGMobject):
         if self.organize_left_to_right:
             self.organize_submobjects_left_to_right()
 
+    def generate_points(self):
+        cache_file = self.get_geometry_cache_file()
+        if not self.load_geometry_cache(cache_file):
+            SVGMobject.generate_points(self)
+            self.save_geometry_cache(cache_file)
+
+    def get_geometry_cache_file(self):
+        return os.path.splitext(self.file_path)[0] + ".npz"
+
+    def load_geometry_cache(self, cache_file):
+        """
+        Rebuilds the glyphs stored by save_geometry_cache, skipping
+        the svg parse.  Returns whether the cache could be used.
+        """
+        try:
+            if os.path.getmtime(cache_file) < os.path.getmtime(self.file_path):
+                return False
+            with np.load(cache_file) as data:
+                if data["version"] != TEX_GEOMETRY_CACHE_VERSION:
+                    return False
+                points = data["points"]
+                point_counts = data["point_counts"]
+                subpath_counts = data["subpath_counts"]
+                path_strings = data["path_strings"]
+        except Exception:
+            return False
+        ends = np.cumsum(point_counts)
+        all_points = np.split(points, ends[:-1])
+        index = 0
+        for path_string, subpath_count in zip(path_strings, subpath_counts):
+            if subpath_count < 0:
+                # A shape other than a glyph, e.g. the rule of a fraction
+                glyph = VMobject()
+                subpath_count = 0
+            else:
+                glyph = TexSymbol("")
+                glyph.path_string = str(path_string)
+            glyph.set_points(all_points[index])
+            for subpath_points in all_points[index + 1:index + 1 + subpath_count]:
+                glyph.add_subpath(subpath_points)
+            self.add(glyph)
+            index += 1 + subpath_count
+        return True
+
+    def save_geometry_cache(self, cache_file):
+        """
+        Stores the points of each glyph and of its subpaths, with a
+        subpath count of -1 marking shapes other than glyphs.  Nothing is
+        stored if the svg produced any other mobject structure.
+        """
+        glyphs = self.submobjects
+        subpath_counts = []
+        for glyph in glyphs:
+            if isinstance(glyph, TexSymbol):
+                if not all(sm.is_subpath and not sm.submobjects for sm in glyph.submobjects):
+                    return
+                subpath_counts.append(len(glyph.submobjects))
+            elif isinstance(glyph, VMobject) and not glyph.submobjects:
+                subpath_counts.append(-1)
+            else:
+                return
+        all_points = [np.zeros((0, self.dim))]
+        for glyph in glyphs:
+            all_points.append(glyph.points)
+            all_points += [sm.points for sm in glyph.submobjects]
+        temp_file = "%s.%d.tmp" % (cache_file, os.getpid())
+        with open(temp_file, "wb") as outfile:
+            np.savez(
+                outfile,
+                version=TEX_GEOMETRY_CACHE_VERSION,
+                points=np.concatenate(all_points),
+                point_counts=np.array([len(p) for p in all_points[1:]], dtype=int),
+                subpath_counts=np.array(subpath_counts, dtype=int),
+                path_strings=np.array([
+                    getattr(glyph, "path_string", "") for glyph in glyphs
+                ], dtype=str),
+            )
+        os.replace(temp_file, cache_file)
+
+    def get_tex_file_requirements(self, tex_string):
+        return [(
+            self.get_modified_expression(tex_string),
+            self.template_tex_file_body
+        )]
+
     def get_modified_expression(self, tex_string):
         result = self.alignment + " " + tex_string
         result = result.strip()
@@ -147,6 +247,18 @@ class TexMobject(SingleStringTexMobject):
         if self.organize_left_to_right:
             self.organize_submobjects_left_to_right()
 
+    def get_tex_file_requirements(self, *tex_strings):
+        tex_strings = self.break_up_tex_strings(tex_strings)
+        result = SingleStringTexMobject.get_tex_file_requirements(
+            self, self.arg_separator.join(tex_strings)
+        )
+        # Mirrors break_up_by_substrings
+        for tex_string in tex_strings:
+            result += get_tex_file_requirements(
+                SingleStringTexMobject, tex_string, **self.CONFIG
+            )
+        return result
+
     def break_up_tex_strings(self, tex_strings):
         substrings_to_isolate = op.add(
             self.substrings_to_isolate,
@@ -264,6 +376,10 @@ class BulletedItem(TextMobject):
         dot.next_to(self[0], LEFT, 1.5*SMALL_BUFF)
         self.add_to_back(dot)
 
+    def get_tex_file_requirements(self, item):
+        return TextMobject.get_tex_file_requirements(self, item) + \
+            get_tex_file_requirements(TexMobject, "\\cdot")
+
 
 class BulletedList(TextMobject):
     CONFIG = {
@@ -1,5 +1,7 @@
 
 
+import weakref
+
 import numpy as np
 
 from PIL import Image
@@ -25,6 +27,23 @@ class AbstractImageMobject(Mobject):
     def get_pixel_array(self):
         raise Exception("Not implemented")
 
+    def get_pixel_version(self):
+        """
+        Returns a number that changes whenever the pixel array does,
+        and that only copies of this pixel array share, or None if
+        that can't be known.  The camera caches resized images by it.
+        """
+        return None
+
+    def get_pixel_source(self):
+        """
+        Returns an image mobject and an opacity such that these pixels
+        are that image's with its alpha channel scaled by the opacity,
+        so that the camera can draw faded images from the resized
+        image it cached for the unfaded one.
+        """
+        return self, 1
+
     def set_color(self):
         # Likely to be implemented in subclasses, but no obgligation
         pass
@@ -50,6 +69,17 @@ class ImageMobject(AbstractImageMobject):
         "invert": False,
         "image_mode": "RGBA",
     }
+    # Incremented whenever the pixels of any image change,
+    # see get_pixel_version
+    pixel_version_counter = 0
+    pixel_version = 0
+    # Like pixel_version, but only changes with the rgb channels
+    rgb_version = 0
+    # The alpha of every pixel, when set_opacity made it the same
+    uniform_alpha = None
+    # A weak reference to the image these pixels are a faded copy of,
+    # its pixel version then and the opacity, see get_pixel_source
+    faded_source = None
 
     def __init__(self, filename_or_array, **kwargs):
         digest_config(self, kwargs)
@@ -62,8 +92,31 @@ class ImageMobject(AbstractImageMobject):
         self.change_to_rgba_array()
         if self.invert:
             self.pixel_array[:, :, :3] = 255 - self.pixel_array[:, :, :3]
+            self.note_pixel_change()
         AbstractImageMobject.__init__(self, **kwargs)
 
+    @property
+    def pixel_array(self):
+        return self._pixel_array
+
+    @pixel_array.setter
+    def pixel_array(self, pixel_array):
+        self._pixel_array = pixel_array
+        self.note_pixel_change()
+
+    def note_pixel_change(self, rgb_changed=True):
+        """
+        Assigning pixel_array does this already, it only needs to be
+        called after changing it in place, e.g. with
+        image.pixel_array[:, :, 3] = 0, rgb_changed=False.
+        """
+        ImageMobject.pixel_version_counter += 1
+        self.pixel_version = ImageMobject.pixel_version_counter
+        if rgb_changed:
+            self.rgb_version = self.pixel_version
+        self.uniform_alpha = None
+        self.faded_source = None
+
     def change_to_rgba_array(self):
         pa = self.pixel_array
         if len(pa.shape) == 2:
@@ -81,11 +134,31 @@ class ImageMobject(AbstractImageMobject):
     def get_pixel_array(self):
         return self.pixel_array
 
+    def get_pixel_version(self):
+        return self.pixel_version
+
+    def get_pixel_source(self):
+        if self.faded_source is not None:
+            source_ref, version, opacity = self.faded_source
+            source = source_ref()
+            if source is not None and source.pixel_version == version:
+                return source, opacity
+        return self, 1
+
+    def set_faded_source(self, image_mobject, opacity):
+        source, source_opacity = image_mobject.get_pixel_source()
+        self.faded_source = (
+            weakref.ref(source), source.pixel_version, opacity * source_opacity
+        )
+
     def set_color(self, color, alpha=None, family=True):
         rgb = color_to_int_rgb(color)
         self.pixel_array[:, :, :3] = rgb
         if alpha is not None:
             self.pixel_array[:, :, 3] = int(255 * alpha)
+        self.note_pixel_change()
+        if alpha is not None:
+            self.uniform_alpha = int(255 * alpha)
         for submob in self.submobjects:
             submob.set_color(color, alpha, family)
         self.color = color
@@ -93,6 +166,8 @@ class ImageMobject(AbstractImageMobject):
 
     def set_opacity(self, alpha):
         self.pixel_array[:, :, 3] = int(255 * alpha)
+        self.note_pixel_change(rgb_changed=False)
+        self.uniform_alpha = int(255 * alpha)
         return self
 
     def fade(self, darkness=0.5):
@@ -101,9 +176,22 @@ class ImageMobject(AbstractImageMobject):
 
     def interpolate_color(self, mobject1, mobject2, alpha):
         assert(mobject1.pixel_array.shape == mobject2.pixel_array.shape)
-        self.pixel_array = interpolate(
-            mobject1.pixel_array, mobject2.pixel_array, alpha
-        ).astype(self.pixel_array_dtype)
+        if mobject1.rgb_version != mobject2.rgb_version:
+            self.pixel_array = interpolate(
+                mobject1.pixel_array, mobject2.pixel_array, alpha
+            ).astype(self.pixel_array_dtype)
+            return
+        # Only the opacities differ, as in FadeIn and FadeOut
+        pixel_array = np.array(mobject2.pixel_array)
+        pixel_array[:, :, 3] = interpolate(
+            mobject1.pixel_array[:, :, 3], mobject2.pixel_array[:, :, 3], alpha
+        )
+        self.pixel_array = pixel_array
+        self.rgb_version = mobject2.rgb_version
+        if mobject1.uniform_alpha == 0:
+            self.set_faded_source(mobject2, alpha)
+        elif mobject2.uniform_alpha == 0:
+            self.set_faded_source(mobject1, 1 - alpha)
 
 # TODO, add the ability to have the dimensions/orientation of this
 # mobject more strongly tied to the frame of the camera it contains,
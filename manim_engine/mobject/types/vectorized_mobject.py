@@ -308,6 +308,7 @@ class VMobject(Mobject):
         if len(self.points) == 0:
             self.points = np.zeros((1, 3))
         self.points[0] = point
+        self.note_geometry_change()
         return self
 
     def add_control_points(self, control_points):
@@ -331,6 +332,7 @@ class VMobject(Mobject):
         arrays = [handles1, handles2, anchors[1:]]
         for index, array in enumerate(arrays):
             self.points[index + 1::3] = array
+        self.note_geometry_change()
         return self.points
 
     def set_points_as_corners(self, points):
@@ -562,16 +564,29 @@ class VMobject(Mobject):
                 setattr(self, attr, getattr(mobject2, attr))
 
     def pointwise_become_partial(self, mobject, a, b):
+        pointwise_become_partials([self], [mobject], [a], [b])
+        return self
+
+
+def pointwise_become_partials(vmobjects, mobjects, lower_alphas, upper_alphas):
+    """
+    Does vmobject.pointwise_become_partial(mobject, a, b) for
+    each vmobject, mobject, a and b, cutting the cubics at the
+    ends of all of them with one partial_bezier_points call.
+    """
+    # Partial curve includes three portions:
+    # - A middle section, which matches the curve exactly
+    # - A start, which is some ending portion of an inner cubic
+    # - An end, which is the starting portion of a later inner cubic
+    # The ends to cut, grouped by their number of points
+    ends = {}
+    for vmobject, mobject, a, b in zip(vmobjects, mobjects, lower_alphas, upper_alphas):
         assert(isinstance(mobject, VMobject))
-        # Partial curve includes three portions:
-        # - A middle section, which matches the curve exactly
-        # - A start, which is some ending portion of an inner cubic
-        # - An end, which is the starting portion of a later inner cubic
         if a <= 0 and b >= 1:
-            self.set_points(mobject.points)
-            self.mark_paths_closed = mobject.mark_paths_closed
-            return self
-        self.mark_paths_closed = False
+            vmobject.set_points(mobject.points)
+            vmobject.mark_paths_closed = mobject.mark_paths_closed
+            continue
+        vmobject.mark_paths_closed = False
         num_cubics = mobject.get_num_anchor_points() - 1
         lower_index = int(a * num_cubics)
         upper_index = int(b * num_cubics)
@@ -583,17 +598,22 @@ class VMobject(Mobject):
             b_residue = (num_cubics * b) % 1
             if b == 1:
                 b_residue = 1
-            elif lower_index == upper_index:
-                b_residue = (b_residue - a_residue) / (1 - a_residue)
-
-            points[:4] = partial_bezier_points(
-                points[:4], a_residue, 1
-            )
-            points[-4:] = partial_bezier_points(
-                points[-4:], 0, b_residue
-            )
-        self.set_points(points)
-        return self
+            if len(points) <= 4:
+                # The start and the end are the same cubic
+                cuts = [(points, a_residue, b_residue)]
+            else:
+                cuts = [(points[:4], a_residue, 1), (points[-4:], 0, b_residue)]
+            for cut in cuts:
+                ends.setdefault(len(cut[0]), []).append(cut)
+        # The ends are views of points, cut in place below
+        vmobject.points = points
+    for cuts in ends.values():
+        curves, a_residues, b_residues = zip(*cuts)
+        partials = partial_bezier_points(curves, a_residues, b_residues)
+        for curve, partial in zip(curves, partials):
+            curve[:] = partial
+    for vmobject in vmobjects:
+        vmobject.note_geometry_change()
 
 
 class VGroup(VMobject):
@@ -655,3 +675,4 @@ class DashedMobject(VMobject):
             dash = VMobject(color=self.get_color())
             dash.pointwise_become_partial(mobject, a, b)
             self.submobjects.append(dash)
+        self.note_geometry_change()
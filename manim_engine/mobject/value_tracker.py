@@ -23,6 +23,7 @@ class ValueTracker(Mobject):
 
     def set_value(self, value):
         self.points[0, 0] = value
+        self.note_geometry_change()
         return self
 
     def increment_value(self, d_value):
@@ -7,6 +7,7 @@ import random
 import shutil
 import subprocess as sp
 import warnings
+import zlib
 
 from tqdm import tqdm as ProgressDisplay
 
@@ -20,8 +21,7 @@ from manim_engine.utils.iterables import list_update
 from manim_engine.utils.output_directory_getters import add_extension_if_not_present
 from manim_engine.utils.output_directory_getters import get_movie_output_directory
 from manim_engine.utils.output_directory_getters import get_image_output_directory
-from manim_engine.utils.output_directory_getters import in_sanim_mode
-from manim_engine.utils.output_directory_getters import get_sanim_source_dir
+from manim_engine.utils.frame_writer import FrameWriter
 from manim_engine.container.container import Container
 
 
@@ -43,11 +43,29 @@ class Scene(Container):
         "random_seed": 0,
         "start_at_animation_number": None,
         "end_at_animation_number": None,
+        # A frame shown for at least this many seconds in a row is
+        # piped to ffmpeg once, and ffmpeg repeats it
+        "min_hold_duration": 1.0,
+        # Frames are handed to ffmpeg by a background thread, through
+        # this many frame buffers.  0 writes them from the render loop.
+        "num_frame_writer_buffers": 4,
+        # Frames of play which are the same as the last one are
+        # neither rendered nor written again, but added as repeats
+        "deduplicate_frames": True,
+        # Skip all animations, but still advance current_scene_time
+        # as if their frames had been rendered
+        "dry_run": False,
+        # Sanim presentation rendered by this scene.  If set, the scene
+        # is in sanim mode, and writes its files next to this file
+        "sanim_source_file": None,
     }
 
     def __init__(self, **kwargs):
         # Perhaps allow passing in a non-empty *mobjects parameter?
         Container.__init__(self, **kwargs)
+        if self.dry_run:
+            self.skip_animations = True
+            self.write_to_movie = False
         self.camera = self.camera_class(**self.camera_config)
         self.mobjects = []
         self.continual_animations = []
@@ -57,6 +75,12 @@ class Scene(Container):
         self.shared_locals = {}
         self.frame_num = 0
         self.current_scene_time = 0
+        self.writing_process = None
+        self.frame_writer = None
+        self.args_to_rename_file = None
+        self.movie_piece_files = []
+        self.movie_segment_files = []
+        self.temporary_movie_segment_files = []
         self.original_skipping_status = self.skip_animations
         if self.name is None:
             self.name = self.__class__.__name__
@@ -65,8 +89,8 @@ class Scene(Container):
             np.random.seed(self.random_seed)
 
         self.setup()
-        if self.write_to_movie:
-            self.open_movie_pipe()
+        # The movie pipe is opened by add_frames, once there is
+        # something to write
         try:
             self.construct(*self.construct_args)
         except EndSceneEarlyException:
@@ -74,11 +98,12 @@ class Scene(Container):
 
         # Always tack on one last frame, so that scenes
         # with no play calls still display something
-        self.skip_animations = False
+        self.skip_animations = self.dry_run
         self.wait(self.frame_duration)
 
         if self.write_to_movie:
             self.close_movie_pipe()
+        self.close_frame_writer()
         print("Played a total of %d animations" % self.num_plays)
 
     def setup(self):
@@ -166,6 +191,45 @@ class Scene(Container):
         kwargs["include_submobjects"] = include_submobjects
         self.capture_mobjects_in_camera(mobjects, **kwargs)
 
+    def update_frame_region(self, mobjects, background, previous_region):
+        """
+        Same as update_frame(mobjects, background), for a camera pixel
+        array which holds background plus mobjects as they were drawn
+        when previous_region was returned.  Only the pixels where the
+        mobjects were or are now get restored and redrawn.  Returns the
+        region to pass in next time.
+        """
+        if self.skip_animations:
+            return previous_region
+        region = self.camera.get_pixel_bounding_box(mobjects)
+        dirty_region = region
+        if previous_region is not None:
+            if region is None:
+                dirty_region = previous_region
+            else:
+                dirty_region = (
+                    min(region[0], previous_region[0]),
+                    min(region[1], previous_region[1]),
+                    max(region[2], previous_region[2]),
+                    max(region[3], previous_region[3]),
+                )
+        if dirty_region is not None:
+            self.camera.set_pixel_array_region(background, dirty_region)
+        self.capture_mobjects_in_camera(mobjects, include_submobjects=True)
+        return region
+
+    def get_frame_checksum(self, region=None):
+        """
+        Returns a crc32 of the camera's pixels, together with region.
+        Frames drawn with update_frame_region only differ inside the
+        region, so that is all which gets checksummed.
+        """
+        pixel_array = self.camera.get_pixel_array()
+        if region is not None:
+            left, top, right, bottom = region
+            pixel_array = pixel_array[top:bottom, left:right]
+        return (region, zlib.crc32(np.ascontiguousarray(pixel_array).data))
+
     def freeze_background(self):
         self.update_frame()
         self.set_camera(Camera(self.get_frame()))
@@ -474,19 +538,56 @@ class Scene(Container):
         self.update_frame(excluded_mobjects=moving_mobjects)
         static_image = self.get_frame()
         total_run_time = 0
+        region = None
+        # Frames only depend on the animations' eased alphas,
+        # unless something else updates the mobjects
+        deduplicate = self.deduplicate_frames and not self.skip_animations and not (
+            self.continual_animations or
+            any(mob.updaters for mob in self.get_mobject_family_members())
+        )
+        last_alphas = None
+        last_checksum = None
+        num_repeats = 0
         for t in self.get_animation_time_progression(animations):
+            if deduplicate:
+                alphas = [
+                    animation.rate_func(np.clip(t / animation.run_time, 0, 1))
+                    for animation in animations
+                ]
+                if alphas == last_alphas:
+                    num_repeats += 1
+                    total_run_time = t
+                    continue
+                last_alphas = alphas
             for animation in animations:
                 animation.update(t / animation.run_time)
             self.continual_update(dt=t - total_run_time)
-            self.update_frame(moving_mobjects, static_image)
-            self.add_frames(self.get_frame())
             total_run_time = t
+            if num_repeats > 0:
+                # The camera still holds the repeated frame
+                self.add_frame(self.camera.get_pixel_array(), num_repeats)
+                num_repeats = 0
+            if self.camera.use_dirty_rectangles:
+                region = self.update_frame_region(moving_mobjects, static_image, region)
+            else:
+                self.update_frame(moving_mobjects, static_image)
+            if deduplicate:
+                checksum = self.get_frame_checksum(region)
+                if checksum == last_checksum:
+                    num_repeats += 1
+                    continue
+                last_checksum = checksum
+            self.add_frame(self.camera.get_pixel_array())
+        if num_repeats > 0:
+            self.add_frame(self.camera.get_pixel_array(), num_repeats)
         self.mobjects_from_last_animation = [
             anim.mobject for anim in animations
         ]
         self.clean_up_animations(*animations)
         if self.skip_animations:
             self.continual_update(total_run_time)
+            run_time = np.max([animation.run_time for animation in animations])
+            self.add_dry_run_frames(len(np.arange(0, run_time, self.frame_duration)))
         else:
             self.continual_update(0)
         self.num_plays += 1
@@ -509,16 +610,17 @@ class Scene(Container):
             for t in self.get_time_progression(duration):
                 self.continual_update(dt=t - total_time)
                 self.update_frame()
-                self.add_frames(self.get_frame())
+                self.add_frame(self.camera.get_pixel_array())
                 total_time = t
+            if self.skip_animations:
+                self.add_dry_run_frames(len(np.arange(0, duration, self.frame_duration)))
         elif self.skip_animations:
-            # Do nothing
+            self.add_dry_run_frames(int(duration / self.frame_duration))
             return self
         else:
             self.update_frame()
             n_frames = int(duration / self.frame_duration)
-            frame = self.get_frame()
-            self.add_frames(*[frame] * n_frames)
+            self.add_frame(self.camera.get_pixel_array(), n_frames)
         return self
 
     def wait_to(self, time, assert_positive=True):
@@ -542,22 +644,70 @@ class Scene(Container):
             self.skip_animations = self.original_skipping_status
         return self
 
+    def add_dry_run_frames(self, num_frames):
+        """
+        Advances current_scene_time by the num_frames frames which
+        were skipped, if this is a dry run.
+        """
+        if self.dry_run:
+            self.current_scene_time += num_frames * self.frame_duration
+
     def add_frames(self, *frames):
         if self.skip_animations:
             return
         self.current_scene_time += len(frames) * self.frame_duration
-        if self.write_to_movie:
-            # print('adding ',len(frames),' frames')
-            for frame in frames:
-                if self.save_pngs:
-                    self.save_image(
-                        "frame" + str(self.frame_num), self.pngs_mode, True)
-                    self.frame_num = self.frame_num + 1
-                string = frame.tostring()
-                self.writing_process.stdin.write(string)
+        for frame in frames:
+            self.write_frame(frame)
         if self.save_frames:
             self.saved_frames += list(frames)
 
+    def add_frame(self, frame, num_frames=1):
+        """
+        Adds frame num_frames times.  frame may be the camera's own
+        pixel array, as it is not kept: it's written to the movie
+        without being copied, and copied once if save_frames is set.
+        """
+        if self.skip_animations:
+            return
+        self.current_scene_time += num_frames * self.frame_duration
+        self.write_frame(frame, num_frames)
+        if self.save_frames:
+            self.saved_frames += [np.array(frame)] * num_frames
+
+    def write_frame(self, frame, num_frames=1):
+        if not self.write_to_movie:
+            return
+        if not self.movie_pipe_is_open():
+            self.open_movie_pipe()
+        if num_frames * self.frame_duration >= self.min_hold_duration and not self.save_pngs:
+            self.hold_frame(frame, num_frames)
+            return
+        if self.writing_process is None:
+            self.writing_process = self.start_movie_piece()
+        if self.save_pngs:
+            for i in range(num_frames):
+                self.save_image(
+                    "frame" + str(self.frame_num), self.pngs_mode, True)
+                self.frame_num = self.frame_num + 1
+        if self.num_frame_writer_buffers > 0:
+            if self.frame_writer is None:
+                self.frame_writer = FrameWriter(
+                    frame.shape, frame.dtype, self.num_frame_writer_buffers
+                )
+            self.frame_writer.write(self.writing_process.stdin, frame, num_frames)
+            return
+        # The pipe reads straight out of the array's buffer
+        data = memoryview(np.ascontiguousarray(frame)).cast("B")
+        for i in range(num_frames):
+            self.writing_process.stdin.write(data)
+
+    def close_frame_writer(self):
+        if self.frame_writer is None:
+            return
+        self.frame_writer.close()
+        print(self.frame_writer.get_stats_message())
+        self.frame_writer = None
+
     # Display methods
 
     def show_frame(self):
@@ -568,8 +718,10 @@ class Scene(Container):
         sub_dir = "images"
         if dont_update:
             sub_dir = str(self)
-        path = get_image_output_directory(self.__class__, sub_dir)
-        if in_sanim_mode():
+        path = get_image_output_directory(
+            self.__class__, sub_dir, self.sanim_source_file
+        )
+        if self.sanim_source_file is not None:
             file_name = "pic.png"
         else:
             file_name = add_extension_if_not_present(name or str(self), ".png")
@@ -585,12 +737,13 @@ class Scene(Container):
 
     def get_movie_file_path(self, name=None, extension=None):
         directory = get_movie_output_directory(
-            self.__class__, self.camera_config, self.frame_duration
+            self.__class__, self.camera_config, self.frame_duration,
+            self.sanim_source_file
         )
         if extension is None:
             extension = self.movie_file_extension
         if name is None:
-            if in_sanim_mode():
+            if self.sanim_source_file is not None:
                 name = SANIM_VIDEO_FILE
             else:
                 name = self.name
@@ -599,37 +752,45 @@ class Scene(Container):
             file_path += extension
         return file_path
 
-    def open_movie_pipe(self):
-        if hasattr(self, 'writing_process') and self.writing_process is not None:
+    def open_movie_pipe(self, file_path=None):
+        """
+        Frames added from now on are encoded to file_path, which defaults
+        to the movie file, or to a new segment if the movie is being
+        written in segments.
+        """
+        if self.movie_pipe_is_open():
             print("Warning: Movie pipe was already open")
             return
 
-        if in_sanim_mode():
-            name = SANIM_VIDEO_FILE
-        else:
-            name = str(self)
-        file_path = self.get_movie_file_path(name)
-        temp_file_path = file_path.replace(name, name + "Temp")
+        if file_path is None:
+            if self.movie_segment_files:
+                file_path = self.get_temporary_movie_segment_file_path()
+            else:
+                file_path = self.get_movie_file_path()
+        root, extension = os.path.splitext(file_path)
+        temp_file_path = root + "Temp" + extension
         print("Writing to %s" % temp_file_path)
-        print(f"Debug - File paths:")
-        print(f"  file_path: {file_path}")
-        print(f"  temp_file_path: {temp_file_path}")
-        print(f"  file_path exists: {os.path.exists(file_path)}")
-        print(f"  temp_file_path exists: {os.path.exists(temp_file_path)}")
-        print(f"  file_path dir exists: {os.path.exists(os.path.dirname(file_path))}")
-        print(f"  temp_file_path dir exists: {os.path.exists(os.path.dirname(temp_file_path))}")
         self.args_to_rename_file = (temp_file_path, file_path)
+        self.movie_piece_files = []
 
         # Ensure the output directory exists
         os.makedirs(os.path.dirname(temp_file_path), exist_ok=True)
 
+    def movie_pipe_is_open(self):
+        return self.args_to_rename_file is not None
+
+    def get_movie_encoder_command(self, file_path):
+        """
+        Returns the ffmpeg command which encodes raw frames read from
+        its stdin to file_path.  The input options come last, so that
+        callers can append filters.
+        """
         fps = int(1 / self.frame_duration)
         height = self.camera.get_pixel_height()
         width = self.camera.get_pixel_width()
 
         # Convert Windows path to forward slashes for FFmpeg and ensure it's not truncated
-        ffmpeg_temp_path = os.path.abspath(temp_file_path).replace('\\', '/')
-        print(f"Debug - FFmpeg temp path: {ffmpeg_temp_path}")
+        ffmpeg_file_path = os.path.abspath(file_path).replace('\\', '/')
 
         command = [
             FFMPEG_BIN,
@@ -653,29 +814,155 @@ class Scene(Container):
                 '-vcodec', 'libx264',
                 '-pix_fmt', 'yuv420p',
             ]
-        command += [ffmpeg_temp_path]
-        print(f"Debug - FFmpeg command: {' '.join(command)}")
-        
+        return command, ffmpeg_file_path
+
+    def get_movie_piece_file_path(self):
+        root, extension = os.path.splitext(self.args_to_rename_file[0])
+        file_path = "%sPiece%d%s" % (root, len(self.movie_piece_files), extension)
+        self.movie_piece_files.append(file_path)
+        return file_path
+
+    def start_movie_piece(self, extra_args=[]):
+        """
+        The movie is encoded in pieces, split wherever a frame is held.
+        Starts an ffmpeg process encoding the next piece, and returns it.
+        """
+        command, file_path = self.get_movie_encoder_command(
+            self.get_movie_piece_file_path()
+        )
         try:
-            self.writing_process = sp.Popen(command, stdin=sp.PIPE)
-            print("Debug - FFmpeg process started successfully")
+            return sp.Popen(command + extra_args + [file_path], stdin=sp.PIPE)
         except Exception as e:
             print(f"Error starting FFmpeg process: {e}")
             raise
 
-    def close_movie_pipe(self):
-        if not hasattr(self, 'writing_process') or self.writing_process is None:
-            print("Warning: Movie pipe was not open")
+    def end_movie_piece(self):
+        if self.writing_process is None:
             return
-
         try:
-            print("Debug - Closing FFmpeg process")
+            if self.frame_writer is not None:
+                self.frame_writer.flush()
             self.writing_process.stdin.close()
             self.writing_process.wait()
-            print("Debug - FFmpeg process finished")
         except Exception as e:
             print(f"Error during FFmpeg process: {e}")
             raise
+        finally:
+            self.writing_process = None
+
+    def hold_frame(self, frame, num_frames):
+        """
+        Encodes frame, shown num_frames times, as a piece of its own.
+        Only one copy of the frame goes through the pipe, ffmpeg's tpad
+        filter clones it for the rest.
+        """
+        self.end_movie_piece()
+        process = self.start_movie_piece([
+            '-vf', 'tpad=stop_mode=clone:stop=%d' % (num_frames - 1),
+        ])
+        process.stdin.write(memoryview(np.ascontiguousarray(frame)).cast("B"))
+        process.stdin.close()
+        process.wait()
+
+    def close_movie_pipe(self):
+        if self.movie_segment_files:
+            self.close_movie_segment()
+            self.combine_movie_segments()
+        else:
+            self.finish_movie_pipe()
+
+    def begin_movie_segment(self, file_path):
+        """
+        Ends the current segment of the movie, and encodes the frames
+        added from now on to file_path, as the next one.  Its frames
+        don't depend on those of earlier segments, so that it can be
+        rendered on its own.
+        """
+        self.close_movie_segment()
+        self.camera.clear_sprite_cache()
+        self.open_movie_pipe(file_path)
+
+    def add_movie_segment(self, file_path):
+        """
+        Ends the current segment of the movie, and appends the
+        already encoded file_path to it.
+        """
+        self.close_movie_segment()
+        self.movie_segment_files.append(file_path)
+
+    def close_movie_segment(self):
+        if not self.movie_pipe_is_open():
+            return
+        file_path = self.finish_movie_pipe()
+        if file_path is None:
+            return
+        if file_path == self.get_movie_file_path():
+            # Frames written before the movie was split up
+            segment_file_path = self.get_temporary_movie_segment_file_path()
+            os.replace(file_path, segment_file_path)
+            file_path = segment_file_path
+        self.movie_segment_files.append(file_path)
+
+    def get_temporary_movie_segment_file_path(self):
+        root, extension = os.path.splitext(self.get_movie_file_path())
+        file_path = "%sSegment%d%s" % (root, len(self.movie_segment_files), extension)
+        self.temporary_movie_segment_files.append(file_path)
+        return file_path
+
+    def combine_movie_segments(self):
+        """
+        Concatenates the segments into the movie file, without re-encoding.
+        """
+        self.concatenate_movie_files(self.movie_segment_files, self.get_movie_file_path())
+        for segment_file_path in self.temporary_movie_segment_files:
+            if os.path.exists(segment_file_path):
+                os.remove(segment_file_path)
+        self.movie_segment_files = []
+        self.temporary_movie_segment_files = []
+
+    def concatenate_movie_files(self, file_paths, file_path):
+        list_file_path = os.path.splitext(file_path)[0] + "Segments.txt"
+        with open(list_file_path, "w") as list_file:
+            for segment_file_path in file_paths:
+                segment_file_path = os.path.abspath(segment_file_path).replace('\\', '/')
+                list_file.write("file '%s'\n" % segment_file_path.replace("'", "'\\''"))
+        command = [
+            FFMPEG_BIN,
+            '-y',
+            '-f', 'concat',
+            '-safe', '0',
+            '-i', list_file_path,
+            '-c', 'copy',
+            '-loglevel', 'error',
+            os.path.abspath(file_path).replace('\\', '/'),
+        ]
+        exit_code = sp.call(command)
+        if exit_code != 0:
+            raise Exception("Error concatenating movie segments listed in %s" % list_file_path)
+        os.remove(list_file_path)
+
+    def finish_movie_pipe(self):
+        """
+        Closes the movie pipe and moves the encoded file into place.
+        Returns the path of the file, or None if no frames were added,
+        in which case no file is written.
+        """
+        if not self.movie_pipe_is_open():
+            print("Warning: Movie pipe was not open")
+            return
+
+        self.end_movie_piece()
+        if not self.movie_piece_files:
+            self.args_to_rename_file = None
+            return None
+        temp_file_path = self.args_to_rename_file[0]
+        if len(self.movie_piece_files) == 1:
+            os.replace(self.movie_piece_files[0], temp_file_path)
+        else:
+            self.concatenate_movie_files(self.movie_piece_files, temp_file_path)
+            for piece_file_path in self.movie_piece_files:
+                os.remove(piece_file_path)
+        self.movie_piece_files = []
 
         try:
             if os.name == 'nt':
@@ -719,7 +1006,9 @@ class Scene(Container):
             print(f"Destination: {self.args_to_rename_file[1]}")
             raise
         finally:
-            self.writing_process = None
+            file_path = self.args_to_rename_file[1]
+            self.args_to_rename_file = None
+        return file_path
 
 
 class EndSceneEarlyException(Exception):
@@ -1,7 +1,5 @@
 import numpy as np
 
-from scipy import linalg
-
 from manim_engine.utils.simple_functions import choose_using_cache
 from manim_engine.utils.space_ops import get_norm
 
@@ -24,16 +22,31 @@ def partial_bezier_points(points, a, b):
     describes the portion of the original bezier
     curve on the interval [a, b].
 
-    This algorithm is pretty nifty, and pretty dense.
+    points can also be an array of curves, in which
+    case a and b can be arrays with a number for each.
+
+    Uses de Casteljau's algorithm: splitting at a
+    keeps the portion on [a, 1], and splitting that
+    at (b - a) / (1 - a) keeps the portion on [a, b].
     """
-    a_to_1 = np.array([
-        bezier(points[i:])(a)
-        for i in range(len(points))
-    ])
-    return np.array([
-        bezier(a_to_1[:i + 1])((b - a) / (1. - a))
-        for i in range(len(points))
-    ])
+    points = np.array(points, dtype=float)
+    a = np.asarray(a, dtype=float)[..., np.newaxis, np.newaxis]
+    b = np.asarray(b, dtype=float)[..., np.newaxis, np.newaxis]
+    n = points.shape[-2] - 1
+    # Leaves point i of level n - i of the de Casteljau
+    # triangle at a in points[i], i.e. the portion on [a, 1]
+    for k in range(1, n + 1):
+        points[..., :n - k + 1, :] = interpolate(
+            points[..., :n - k + 1, :], points[..., 1:n - k + 2, :], a
+        )
+    # Leaves point 0 of level i of the triangle at t
+    # in points[i], i.e. the portion of that on [0, t]
+    t = (b - a) / (1. - a)
+    for k in range(1, n + 1):
+        points[..., k:, :] = interpolate(
+            points[..., k - 1:n, :], points[..., k:, :], t
+        )
+    return points
 
 
 # Linear interpolation variants
@@ -61,6 +74,8 @@ def match_interpolate(new_start, new_end, old_start, old_end, old_value):
 
 
 def get_smooth_handle_points(points):
+    # scipy takes a while to import, and is rarely needed
+    from scipy import linalg
     points = np.array(points)
     num_handles = len(points) - 1
     dim = points.shape[1]
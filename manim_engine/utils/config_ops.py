@@ -1,6 +1,7 @@
 import inspect
-import operator as op
-from functools import reduce
+
+# Resolved CONFIG of each class, see get_class_config
+class_config_cache = {}
 
 
 def instantiate(obj):
@@ -39,34 +40,84 @@ def digest_config(obj, kwargs, caller_locals={}):
     be easily passed into instantiation, and is attached
     as an attribute of the object.
     """
+    class_config = get_class_config(obj.__class__)
+    static_config, static_dict_values, merged_keys = class_config[1:]
+
+    # Order matters a lot here, first dicts have higher priority
+    caller_locals = filtered_locals(caller_locals)
+    given_config = merge_config([kwargs, caller_locals, obj.__dict__])
+    # Keys keep the order of their first appearance
+    config = dict(given_config)
+    config.update(static_config)
+    for key, value in given_config.items():
+        if key in static_dict_values and isinstance(value, dict):
+            value = merge_config([value] + static_dict_values[key])
+        config[key] = value
+    # Dicts merged from several CONFIGs are not shared between objects
+    for key in merged_keys:
+        if config[key] is static_config[key]:
+            config[key] = merge_config(static_dict_values[key])
+    obj.__dict__ = config
+
+
+def get_class_config(Class):
+    """
+    Merges the CONFIGs of Class and all its super classes, once
+    per class.
+
+    Returns a tuple with the CONFIGs it was merged from, the merged
+    config, the dict values that each key takes in the CONFIGs, and
+    the keys whose value was merged from several dicts.
+    """
+    cached = class_config_cache.get(Class)
+    if cached is not None:
+        for C, config, size in cached[0]:
+            if getattr(C, "CONFIG", None) is not config or len(config) != size:
+                break
+        else:
+            return cached
 
     # Assemble list of CONFIGs from all super classes
-    classes_in_hierarchy = [obj.__class__]
-    static_configs = []
+    sources = []
+    classes_in_hierarchy = [Class]
     while len(classes_in_hierarchy) > 0:
-        Class = classes_in_hierarchy.pop()
-        classes_in_hierarchy += Class.__bases__
-        if hasattr(Class, "CONFIG"):
-            static_configs.append(Class.CONFIG)
+        C = classes_in_hierarchy.pop()
+        classes_in_hierarchy += C.__bases__
+        if hasattr(C, "CONFIG"):
+            sources.append((C, C.CONFIG, len(C.CONFIG)))
+    static_configs = [config for C, config, size in sources]
+
+    static_config = merge_config(static_configs)
+    static_dict_values = dict()
+    for config in static_configs:
+        for key, value in config.items():
+            if isinstance(value, dict):
+                static_dict_values.setdefault(key, []).append(value)
+    merged_keys = [
+        key for key, values in static_dict_values.items()
+        if len(values) > 1 and isinstance(static_config[key], dict)
+    ]
+    result = (sources, static_config, static_dict_values, merged_keys)
+    class_config_cache[Class] = result
+    return result
 
-    # Order matters a lot here, first dicts have higher priority
-    caller_locals = filtered_locals(caller_locals)
-    all_dicts = [kwargs, caller_locals, obj.__dict__]
-    all_dicts += static_configs
-    all_new_dicts = [kwargs, caller_locals] + static_configs
-    obj.__dict__ = merge_config(all_dicts)
+
+def clear_config_cache():
+    """
+    Must be called after changing the value of a key of some CONFIG in
+    place. Replacing a CONFIG, or adding or removing keys, is detected.
+    """
+    class_config_cache.clear()
 
 
 def merge_config(all_dicts):
-    all_config = reduce(op.add, [list(d.items()) for d in all_dicts])
     config = dict()
-    for c in all_config:
-        key, value = c
-        if not key in config:
-            config[key] = value
-        else:
-            # When two dictionaries have the same key, they are merged.
-            if isinstance(value, dict) and isinstance(config[key], dict):
+    for d in all_dicts:
+        for key, value in d.items():
+            if key not in config:
+                config[key] = value
+            elif isinstance(value, dict) and isinstance(config[key], dict):
+                # When two dictionaries have the same key, they are merged.
                 config[key] = merge_config([config[key], value])
     return config
 
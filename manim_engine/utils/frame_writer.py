@@ -0,0 +1,96 @@
+import queue
+import threading
+import time
+
+import numpy as np
+
+
+class FrameWriter(object):
+    """
+    Writes frames to ffmpeg pipes from a background thread, so that
+    rendering a frame overlaps with piping and encoding the previous
+    ones.  Frames are copied into a fixed ring of preallocated buffers,
+    and write blocks while they are all waiting to be written.
+    """
+
+    def __init__(self, frame_shape, dtype, num_buffers):
+        self.free_buffers = queue.Queue()
+        for i in range(num_buffers):
+            self.free_buffers.put(np.empty(frame_shape, dtype=dtype))
+        self.pending = queue.Queue()
+        self.error = None
+        self.num_buffers = num_buffers
+        self.num_writes = 0
+        self.total_queue_depth = 0
+        self.max_queue_depth = 0
+        # Time the renderer waited for a free buffer
+        self.render_stall_time = 0
+        # Time the writer thread waited for the pipe to take a frame
+        self.pipe_stall_time = 0
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def write(self, stream, frame, num_frames=1):
+        """
+        Queues frame to be written num_frames times to stream.
+        """
+        self.raise_error()
+        start_time = time.time()
+        buffer = self.free_buffers.get()
+        self.render_stall_time += time.time() - start_time
+        np.copyto(buffer, frame)
+        self.pending.put((stream, buffer, num_frames))
+        queue_depth = self.num_buffers - self.free_buffers.qsize()
+        self.num_writes += 1
+        self.total_queue_depth += queue_depth
+        self.max_queue_depth = max(self.max_queue_depth, queue_depth)
+
+    def run(self):
+        while True:
+            item = self.pending.get()
+            if item is None:
+                self.pending.task_done()
+                return
+            stream, buffer, num_frames = item
+            try:
+                if self.error is None:
+                    data = memoryview(buffer).cast("B")
+                    for i in range(num_frames):
+                        start_time = time.time()
+                        stream.write(data)
+                        self.pipe_stall_time += time.time() - start_time
+            except Exception as e:
+                self.error = e
+            finally:
+                self.free_buffers.put(buffer)
+                self.pending.task_done()
+
+    def flush(self):
+        """
+        Waits until every queued frame has been written.
+        """
+        self.pending.join()
+        self.raise_error()
+
+    def close(self):
+        self.pending.put(None)
+        self.thread.join()
+        self.raise_error()
+
+    def raise_error(self):
+        if self.error is not None:
+            raise self.error
+
+    def get_stats_message(self):
+        average_queue_depth = self.total_queue_depth / max(self.num_writes, 1)
+        return (
+            "Frame writer: %d writes, queue depth %.1f average, %d max of %d, "
+            "%.2fs rendering stalled on the queue, %.2fs writing stalled on the pipe"
+        ) % (
+            self.num_writes,
+            average_queue_depth,
+            self.max_queue_depth,
+            self.num_buffers,
+            self.render_stall_time,
+            self.pipe_stall_time,
+        )
@@ -1,6 +1,8 @@
 
 import os
+import glob
 import hashlib
+import multiprocessing
 
 from manim_engine.constants import TEX_DIR
 from manim_engine.constants import TEX_TEXT_TO_REPLACE
@@ -20,6 +22,168 @@ def tex_to_svg_file(expression, template_tex_file_body):
     return dvi_to_svg(dvi_file)
 
 
+def get_svg_file_path(expression, template_tex_file_body):
+    return os.path.join(
+        TEX_DIR,
+        tex_hash(expression, template_tex_file_body)
+    ) + ".svg"
+
+
+def tex_to_svg_files(expressions_and_templates, num_processes=None,
+                     max_batch_size=40):
+    """
+    Compiles every (expression, template_tex_file_body) pair whose svg
+    is not cached yet, using a pool of num_processes workers (one per
+    core by default).  Expressions sharing a template are compiled in
+    batches of up to max_batch_size, each a single latex and dvisvgm run.
+    Returns the list of svg paths, in input order.
+    """
+    pairs = list(expressions_and_templates)
+    missing = []
+    for pair in pairs:
+        if pair not in missing and not os.path.exists(get_svg_file_path(*pair)):
+            missing.append(pair)
+    if num_processes is None:
+        num_processes = os.cpu_count() or 1
+
+    # Spread each template's expressions evenly across the workers
+    batches = []
+    templates = []
+    for expression, template_tex_file_body in missing:
+        if template_tex_file_body not in templates:
+            templates.append(template_tex_file_body)
+    for template_tex_file_body in templates:
+        expressions = [e for e, t in missing if t == template_tex_file_body]
+        num_batches = max(
+            min(num_processes, len(expressions)),
+            -(-len(expressions) // max_batch_size),
+        )
+        batch_size = -(-len(expressions) // num_batches)
+        for i in range(0, len(expressions), batch_size):
+            batches.append((expressions[i:i + batch_size], template_tex_file_body))
+
+    num_processes = min(num_processes, len(batches))
+    if num_processes > 1:
+        with multiprocessing.Pool(num_processes) as pool:
+            pool.starmap(tex_to_svg_batch, batches, chunksize=1)
+    else:
+        for batch in batches:
+            tex_to_svg_batch(*batch)
+    return [get_svg_file_path(*pair) for pair in pairs]
+
+
+def tex_to_svg_batch(expressions, template_tex_file_body):
+    """
+    Compiles the expressions as the pages of one document, then splits
+    the result into the svg files tex_to_svg_file would have produced.
+    Falls back to compiling them one by one if the template can't be
+    batched or the batched run fails.
+    """
+    if len(expressions) > 1:
+        batch_body = get_batch_template_tex_file_body(
+            expressions, template_tex_file_body
+        )
+        if batch_body is not None and batch_tex_to_svg_files(
+                batch_body, expressions, template_tex_file_body):
+            return
+    for expression in expressions:
+        tex_to_svg_file(expression, template_tex_file_body)
+
+
+def get_batch_template_tex_file_body(expressions, template_tex_file_body):
+    """
+    Returns a document with one standalone page per expression, or
+    None if the template does not use the standalone class.
+    """
+    head, separator, tail = template_tex_file_body.partition("]{standalone}")
+    if not separator or "\\documentclass[" not in head:
+        return None
+    preamble, begin, rest = (head + ",multi" + separator + tail).partition(
+        "\\begin{document}"
+    )
+    page_template, end, closing = rest.rpartition("\\end{document}")
+    if not begin or not end:
+        return None
+    pages = [
+        "\\begin{standalone}" +
+        page_template.replace(TEX_TEXT_TO_REPLACE, expression) +
+        "\\end{standalone}\n"
+        for expression in expressions
+    ]
+    return preamble + begin + "\n" + "".join(pages) + end + closing
+
+
+def batch_tex_to_svg_files(batch_body, expressions, template_tex_file_body):
+    """
+    Runs latex and dvisvgm once over batch_body, moving page i to the
+    svg file of expressions[i].  Returns whether it succeeded.
+    """
+    base = os.path.join(TEX_DIR, "batch_" + tex_hash(
+        "".join(expressions), batch_body
+    ))
+    tex_file = base + ".tex"
+    write_file_atomically(tex_file, batch_body)
+    commands = [
+        "latex",
+        "-interaction=batchmode",
+        "-halt-on-error",
+        "-output-directory=" + TEX_DIR,
+        tex_file,
+        ">",
+        get_null()
+    ]
+    if os.system(" ".join(commands)) != 0:
+        remove_batch_files(base)
+        return False
+    commands = [
+        "dvisvgm",
+        base + ".dvi",
+        "--page=1-",
+        "-n",
+        "-v",
+        "0",
+        "-o",
+        base + "-%p.svg",
+        ">",
+        get_null()
+    ]
+    os.system(" ".join(commands))
+    page_files = ["%s-%d.svg" % (base, i + 1) for i in range(len(expressions))]
+    too_many_pages = os.path.exists("%s-%d.svg" % (base, len(expressions) + 1))
+    if too_many_pages or not all(map(os.path.exists, page_files)):
+        # Page i must be expression i, otherwise glyphs would end up
+        # under the wrong hash
+        remove_batch_files(base)
+        return False
+    for expression, page_file in zip(expressions, page_files):
+        os.replace(page_file, get_svg_file_path(
+            expression, template_tex_file_body
+        ))
+    remove_batch_files(base)
+    return True
+
+
+def remove_batch_files(base):
+    """
+    Removes the files of a batched run, including the svgs
+    of its pages that were not moved.
+    """
+    file_paths = [base + extension for extension in [".tex", ".dvi", ".aux", ".log"]]
+    file_paths += glob.glob(glob.escape(base) + "-*.svg")
+    for file_path in file_paths:
+        if os.path.exists(file_path):
+            os.remove(file_path)
+
+
+def write_file_atomically(file_path, content):
+    # Concurrent compiles may look for the same file, so it must
+    # never be observed half written
+    temp_path = "%s.%d.tmp" % (file_path, os.getpid())
+    with open(temp_path, "w") as outfile:
+        outfile.write(content)
+    os.replace(temp_path, file_path)
+
+
 def generate_tex_file(expression, template_tex_file_body):
     result = os.path.join(
         TEX_DIR,
@@ -32,8 +196,7 @@ def generate_tex_file(expression, template_tex_file_body):
         new_body = template_tex_file_body.replace(
             TEX_TEXT_TO_REPLACE, expression
         )
-        with open(result, "w") as outfile:
-            outfile.write(new_body)
+        write_file_atomically(result, new_body)
     return result
 
 
@@ -73,6 +236,7 @@ def dvi_to_svg(dvi_file, regen_if_exists=False):
     """
     result = dvi_file.replace(".dvi", ".svg")
     if not os.path.exists(result):
+        temp_result = result.replace(".svg", "-%d.tmp.svg" % os.getpid())
         commands = [
             "dvisvgm",
             dvi_file,
@@ -80,9 +244,11 @@ def dvi_to_svg(dvi_file, regen_if_exists=False):
             "-v",
             "0",
             "-o",
-            result,
+            temp_result,
             ">",
             get_null()
         ]
         os.system(" ".join(commands))
+        if os.path.exists(temp_result):
+            os.replace(temp_result, result)
     return result
@@ -13,16 +13,22 @@ Options:
     -p             Preview in low quality 
     -s             Show and save picture of last frame
     -o <filename>  Write to a different filename
+    --no_cache     Render every segment again instead of reusing cached ones
+    -j <jobs>      Render segments in this many processes
+    --dry_run      Only compute the timestamps and check the layout
 """
 
 import os
 import sys
 import shutil
 import argparse
+import platform
+import multiprocessing
+import subprocess as sp
 
 # Import manim components
-from manim_engine.big_ol_pile_of_manim_imports import *
 from manim_engine.constants import *
+from manim_engine.scene.scene import Scene
 
 # Import utility modules
 from util.exceptions import (SanimParseError, SanimRenderError)
@@ -30,13 +36,13 @@ from util.exceptions import (SanimParseError, SanimRenderError)
 # Import parser and element components
 from util.parsing import InputParser
 from util.rendering import PresentationRenderer
+from util.segment_cache import SegmentCache
 
 # Constants for presentation styling
 BACKGROUND_COLOR = "#e6f3ff"
 DEFINITION_COLOR = "#991f00"
 
 # File path constants
-SANIM_AUX_FILE = 'manim_engine' + os.sep + 'sanim_flag_AUTOGENERATED.txt'
 SANIM_HTML_FILE = "sanim_interactive.html"
 SANIM_LOCAL_HTML_FILE = "sanim_interactive_AUTOGENERATED.html"
 SANIM_VIDEO_FILE = "vid"  # .mp4 extension is added automatically
@@ -48,24 +54,54 @@ class Sanim(Scene):
     """
     
     CONFIG = {
-        "camera_config": {"background_color": BACKGROUND_COLOR}
+        "camera_config": {"background_color": BACKGROUND_COLOR},
+        "reuse_cached_segments": True,
+        # Fingerprints of the segments to render. If set, the scene only fills
+        # the segment cache, without writing the movie or the web player data
+        "fingerprints_to_render": None,
     }
     
     def construct(self):
         """Construct the scene for the presentation."""
         try:
-            # Read the source file path from the auxiliary file
-            with open(SANIM_AUX_FILE, "r") as sanim_file:
-                source_file = sanim_file.read().strip()
+            source_file = self.sanim_source_file
+            if source_file is None:
+                raise SanimParseError("No presentation file given")
             
             # Parse the input file
             lines = InputParser.parse_file(source_file)
             print("Finished parsing")
             
-            # Render the presentation
-            renderer = PresentationRenderer(self)
+            # Render the presentation, reusing the unchanged segments of the
+            # previous renders when writing the whole movie
+            segment_cache = None
+            if can_cache_segments(
+                    self.write_to_movie,
+                    self.skip_animations,
+                    self.save_pngs,
+                    self.end_at_animation_number):
+                segment_cache = SegmentCache(
+                    os.path.dirname(os.path.abspath(source_file)),
+                    self,
+                    reuse_cached_segments=self.reuse_cached_segments
+                )
+            renderer = PresentationRenderer(self, segment_cache, self.fingerprints_to_render)
             time_stamps = renderer.render_presentation(lines)
             
+            if self.fingerprints_to_render is not None:
+                # The segments are in the cache, the parent process writes the movie
+                self.write_to_movie = False
+                self.uncached_fingerprints = renderer.uncached_fingerprints
+                return
+            
+            if segment_cache is not None:
+                # Every segment has been looked up, the others are stale
+                segment_cache.prune()
+            
+            if self.dry_run:
+                self._report_dry_run(source_file, renderer, time_stamps)
+                return
+            
             # Save timestamp data for the web player
             self._save_web_player_data(source_file, time_stamps)
             
@@ -81,6 +117,43 @@ class Sanim(Scene):
             traceback.print_exc()
             sys.exit(1)
     
+    def _report_dry_run(self, source_file, renderer, time_stamps):
+        """
+        Save the timestamps and print the timing and layout of a dry run.
+        
+        Args:
+            source_file: Path to the source file
+            renderer: The PresentationRenderer that laid out the presentation
+            time_stamps: List of timestamps
+            
+        Raises:
+            SanimRenderError: If some element does not fit in the frame
+        """
+        self._save_time_stamps(source_file, time_stamps)
+        print("Slide durations:")
+        for line_num, start_time, duration in renderer.get_slide_durations():
+            print(f"  Line {line_num}: starts at {start_time:.2f}s, lasts {duration:.2f}s")
+        print(f"Total duration: {self.current_scene_time:.2f}s")
+        for warning in renderer.layout_warnings:
+            print(f"WARNING: {warning}")
+        if renderer.layout_warnings:
+            raise SanimRenderError(
+                "Some lines do not fit in the frame"
+            )
+    
+    def _save_time_stamps(self, source_file, time_stamps):
+        """
+        Save the timestamps for the web player next to the source file.
+        
+        Args:
+            source_file: Path to the source file
+            time_stamps: List of timestamps
+        """
+        source_folder = os.path.dirname(os.path.abspath(source_file))
+        web_info_file = os.path.join(source_folder, SANIM_TIME_STAMPS_FILE)
+        with open(web_info_file, 'w') as web_file:
+            web_file.write(f"var timeStamps = {[round(t, 4) for t in time_stamps]}\n")
+    
     def _save_web_player_data(self, source_file, time_stamps):
         """
         Save data for the web player.
@@ -94,9 +167,7 @@ class Sanim(Scene):
             source_folder = os.path.dirname(os.path.abspath(source_file))
             
             # Save timestamps
-            web_info_file = os.path.join(source_folder, SANIM_TIME_STAMPS_FILE)
-            with open(web_info_file, 'w') as web_file:
-                web_file.write(f"var timeStamps = {[round(t, 4) for t in time_stamps]}\n")
+            self._save_time_stamps(source_file, time_stamps)
             
             # Copy HTML template
             source_html = os.path.join(self._get_main_manim_dir(), SANIM_HTML_FILE)
@@ -126,19 +197,85 @@ class Sanim(Scene):
         return module_dir
 
 
-# Utility functions for compatibility with the original sanim.py
+def can_cache_segments(write_to_movie, skip_animations, save_pngs, end_at_animation_number):
+    """
+    Check if a render can be split into cached segments.
+    
+    Only renders that write the whole movie can.
+    
+    Returns:
+        True if the segment cache can be used
+    """
+    return write_to_movie and not any([
+        skip_animations,
+        save_pngs,
+        end_at_animation_number,
+    ])
 
-def get_sanim_source_dir():
+
+def render_segments(scene_kwargs, fingerprints):
     """
-    Get the directory containing the sanim source file.
+    Render the segments with the given fingerprints into the segment cache.
     
+    Args:
+        scene_kwargs: Arguments of the Sanim scene
+        fingerprints: Fingerprints of the segments to render
+    """
+    Sanim(fingerprints_to_render=set(fingerprints), **scene_kwargs)
+
+
+def get_uncached_fingerprints(scene_kwargs):
+    """
+    Play the whole presentation in skip mode to find the segments to render.
+    
+    Args:
+        scene_kwargs: Arguments of the Sanim scene
+        
     Returns:
-        Path to the sanim source directory
+        Fingerprints of the segments missing from the cache, without repeats,
+        in the order they are played
+    """
+    scene = Sanim(fingerprints_to_render=set(), **scene_kwargs)
+    return list(dict.fromkeys(scene.uncached_fingerprints))
+
+
+def render_segments_in_parallel(scene_kwargs, source_file, num_workers):
     """
-    with open(SANIM_AUX_FILE, "r") as sanim_file:
-        source_file = sanim_file.read().strip()
-    return os.path.dirname(os.path.abspath(source_file))
+    Fill the segment cache using several processes.
+    
+    The segments missing from the cache are found first, then each process
+    replays the whole presentation, but only rasterizes and encodes its share
+    of them. The rest are played in skip mode.
+    
+    Args:
+        scene_kwargs: Arguments of the Sanim scene
+        source_file: Path to the presentation source file
+        num_workers: Number of processes
+        
+    Raises:
+        SanimRenderError: If a process fails
+    """
+    # Compile the TeX once, so the processes don't all compile it
+    InputParser.parse_file(source_file)
+    
+    fingerprints = get_uncached_fingerprints(scene_kwargs)
+    num_workers = min(num_workers, len(fingerprints))
+    workers = [
+        multiprocessing.Process(
+            target=render_segments,
+            args=(scene_kwargs, fingerprints[i::num_workers])
+        )
+        for i in range(num_workers)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    if any(worker.exitcode != 0 for worker in workers):
+        raise SanimRenderError("A segment rendering process failed")
+
 
+# Utility functions for compatibility with the original sanim.py
 
 def get_main_manim_dir():
     """
@@ -152,8 +289,13 @@ def get_main_manim_dir():
     return module_dir
 
 
-def parse_args():
-    """Parse command line arguments."""
+def parse_args(argv=None):
+    """
+    Parse command line arguments.
+    
+    Args:
+        argv: Arguments to parse, sys.argv[1:] by default
+    """
     parser = argparse.ArgumentParser(description="Sanim - Slide Animation Tool")
     
     parser.add_argument("presentation_file", help="Path to the Sanim presentation file")
@@ -169,17 +311,16 @@ def parse_args():
     parser.add_argument("-o", "--output_name", help="Write to a different filename")
     parser.add_argument("-n", "--start_at_animation_number", help="Start at specific animation number")
     parser.add_argument("-r", "--resolution", help="Specify resolution (height or height,width)")
+    parser.add_argument("--no_cache", action="store_true", help="Render every segment again instead of reusing cached ones")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="Number of processes rendering segments in parallel")
+    parser.add_argument("--dry_run", action="store_true", help="Only compute the timestamps and check the layout, without rendering")
     
-    return parser.parse_args()
+    return parser.parse_args(argv)
 
 
-def get_configuration():
+def get_configuration(argv=None):
     """Get configuration based on command line arguments."""
-    args = parse_args()
-    
-    # Write the presentation file path to the auxiliary file
-    with open(SANIM_AUX_FILE, "w") as sanim_aux_file:
-        sanim_aux_file.write(args.presentation_file)
+    args = parse_args(argv)
     
     # Process output name
     if args.output_name is not None:
@@ -207,6 +348,10 @@ def get_configuration():
         "output_name": output_name,
         "start_at_animation_number": args.start_at_animation_number,
         "end_at_animation_number": None,
+        "reuse_cached_segments": not args.no_cache,
+        "jobs": args.jobs,
+        "presentation_file": args.presentation_file,
+        "dry_run": args.dry_run,
     }
     
     # Camera configuration
@@ -254,13 +399,34 @@ def get_configuration():
         config["start_at_animation_number"],
     ])
     
+    # A dry run only lays out the presentation
+    if config["dry_run"]:
+        config.update({
+            "write_to_movie": False,
+            "show_last_frame": False,
+            "open_video_upon_completion": False,
+            "show_file_in_finder": False,
+            "save_pngs": False,
+            "start_at_animation_number": None,
+            "end_at_animation_number": None,
+            "jobs": 1,
+        })
+    
     return config
 
 
-def main():
-    """Main entry point function."""
+def main(argv=None):
+    """
+    Main entry point function.
+    
+    Args:
+        argv: Command line arguments, sys.argv[1:] by default
+        
+    Returns:
+        Exit code
+    """
     try:
-        config = get_configuration()
+        config = get_configuration(argv)
         
         # Prepare scene kwargs
         scene_kwargs = dict([
@@ -274,15 +440,32 @@ def main():
                 "movie_file_extension",
                 "start_at_animation_number",
                 "end_at_animation_number",
+                "reuse_cached_segments",
+                "dry_run",
             ]
         ])
         
         scene_kwargs["name"] = config["output_name"]
+        scene_kwargs["sanim_source_file"] = config["presentation_file"]
         if config["save_pngs"]:
             print("We are going to save a PNG sequence as well...")
             scene_kwargs["save_pngs"] = True
             scene_kwargs["pngs_mode"] = config["saved_image_mode"]
         
+        # Render the segments in parallel first, then stitch them from the cache
+        if config["jobs"] > 1:
+            if can_cache_segments(
+                    config["write_to_movie"],
+                    config["skip_animations"],
+                    config["save_pngs"],
+                    config["end_at_animation_number"]):
+                render_segments_in_parallel(
+                    scene_kwargs, config["presentation_file"], config["jobs"]
+                )
+                scene_kwargs["reuse_cached_segments"] = True
+            else:
+                print("WARNING: -j only applies when writing the whole movie, rendering in one process")
+        
         # Create and run scene
         scene = Sanim(**scene_kwargs)
         
@@ -344,6 +527,4 @@ def main():
 
 
 if __name__ == "__main__":
-    import platform
-    import subprocess as sp
     sys.exit(main())
@@ -0,0 +1,257 @@
+#!/usr/bin/env python
+
+"""
+Renders several Sanim presentations at once.
+
+Usage:
+    ./sanim_batch.py <presentation_file_or_folder>... [options]
+
+A folder stands for every presentation in it or its subfolders, that is,
+every file named after the folder it is in, like
+presentations/lecture1/lecture1.txt.
+
+Options:
+    -j <jobs>      Render this many presentations at the same time
+    -l             Use low quality (faster rendering)
+    -m             Use medium quality
+    -r <height>    Specify resolution (height or height,width)
+    --no_cache     Render every segment again instead of reusing cached ones
+    --dry_run      Only compute the timestamps and check the layout
+"""
+
+
+import os
+import sys
+import time
+import argparse
+import multiprocessing
+from multiprocessing.connection import wait
+
+# Import utility modules
+from util.exceptions import (SanimParseError, SanimRenderError)
+
+# Import parser and the single presentation entry point
+from util.parsing import InputParser
+import sanim
+
+
+def find_presentation_files(paths):
+    """
+    Get the presentation files to render.
+
+    Args:
+        paths: Presentation files, or folders to search for presentations
+
+    Returns:
+        List of paths of presentation files
+
+    Raises:
+        SanimParseError: If a path does not exist, or two presentations
+            share a folder, where their output files would overwrite each other
+    """
+    result = []
+    for path in paths:
+        if os.path.isfile(path):
+            result.append(path)
+        elif os.path.isdir(path):
+            for folder, sub_folders, file_names in sorted(os.walk(path)):
+                file_name = os.path.basename(os.path.abspath(folder)) + ".txt"
+                if file_name in file_names:
+                    result.append(os.path.join(folder, file_name))
+        else:
+            raise SanimParseError(f"No such file or folder: {path}")
+
+    folders = {}
+    for presentation_file in result:
+        folder = os.path.dirname(os.path.abspath(presentation_file))
+        if folder in folders:
+            raise SanimParseError(
+                f"{folders[folder]} and {presentation_file} are in the same folder, "
+                "so their output files would overwrite each other"
+            )
+        folders[folder] = presentation_file
+    return result
+
+
+def compile_tex_requirements(presentation_files):
+    """
+    Compile the TeX of all the presentations at once.
+
+    The presentations then find all their TeX in the cache, and common
+    expressions are only compiled once. If some expression does not
+    compile, the TeX of each presentation is compiled on its own, so that
+    only the presentations using it fail.
+
+    Args:
+        presentation_files: Paths of the presentation files
+
+    Returns:
+        Dict with the error of each presentation that could not be read
+        or whose TeX does not compile
+    """
+    from manim_engine.utils.tex_file_writing import tex_to_svg_files
+
+    requirements = {}
+    errors = {}
+    for presentation_file in presentation_files:
+        try:
+            lines = InputParser.read_file(presentation_file)
+            requirements[presentation_file] = InputParser.get_tex_requirements(lines)
+        except SanimParseError as e:
+            errors[presentation_file] = str(e)
+    try:
+        tex_to_svg_files([pair for pairs in requirements.values() for pair in pairs])
+    except Exception:
+        for presentation_file, pairs in requirements.items():
+            try:
+                tex_to_svg_files(pairs)
+            except Exception as e:
+                errors[presentation_file] = f"TeX error: {str(e)}"
+    return errors
+
+
+def render_presentation(sanim_args):
+    """
+    Render a presentation with sanim.py, exiting with its exit code.
+
+    Args:
+        sanim_args: Command line arguments of sanim.py
+    """
+    sys.exit(sanim.main(sanim_args))
+
+
+def render_presentations(presentation_files, options, num_processes):
+    """
+    Render each presentation in its own process, a few at a time.
+
+    Args:
+        presentation_files: Paths of the presentation files
+        options: Command line options of sanim.py for every presentation
+        num_processes: Number of presentations rendered at the same time
+
+    Returns:
+        Dict with the exit code and render time in seconds of each presentation
+    """
+    pending = list(presentation_files)
+    running = {}
+    results = {}
+    while pending or running:
+        while pending and len(running) < num_processes:
+            presentation_file = pending.pop(0)
+            worker = multiprocessing.Process(
+                target=render_presentation,
+                args=([presentation_file] + options,)
+            )
+            worker.start()
+            running[worker.sentinel] = (presentation_file, worker, time.time())
+        for sentinel in wait(list(running.keys())):
+            presentation_file, worker, start_time = running.pop(sentinel)
+            worker.join()
+            results[presentation_file] = (worker.exitcode, time.time() - start_time)
+    return results
+
+
+def print_summary(presentation_files, results, errors, total_time):
+    """
+    Print how each presentation went and how long it took.
+
+    Args:
+        presentation_files: Paths of the presentation files
+        results: Exit code and render time of each rendered presentation
+        errors: Parse or TeX error of each presentation that was not rendered
+        total_time: Time taken by the whole batch in seconds
+    """
+    width = max(len(presentation_file) for presentation_file in presentation_files)
+    print("Summary:")
+    for presentation_file in presentation_files:
+        if presentation_file in errors:
+            print(f"  {presentation_file:<{width}}  failed  {errors[presentation_file]}")
+            continue
+        exit_code, render_time = results[presentation_file]
+        status = "done" if exit_code == 0 else "failed"
+        print(f"  {presentation_file:<{width}}  {status:<6}  {render_time:.1f}s")
+    num_done = sum(1 for exit_code, render_time in results.values() if exit_code == 0)
+    print(f"Rendered {num_done} of {len(presentation_files)} presentations in {total_time:.1f}s")
+
+
+def parse_args(argv=None):
+    """
+    Parse command line arguments.
+
+    Args:
+        argv: Arguments to parse, sys.argv[1:] by default
+    """
+    parser = argparse.ArgumentParser(description="Render several Sanim presentations at once")
+
+    parser.add_argument("paths", nargs="+", help="Presentation files, or folders to search for presentations")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1, help="Number of presentations rendered at the same time")
+    parser.add_argument("-l", "--low_quality", action="store_true", help="Use low quality (faster rendering)")
+    parser.add_argument("-m", "--medium_quality", action="store_true", help="Use medium quality")
+    parser.add_argument("-r", "--resolution", help="Specify resolution (height or height,width)")
+    parser.add_argument("--no_cache", action="store_true", help="Render every segment again instead of reusing cached ones")
+    parser.add_argument("--dry_run", action="store_true", help="Only compute the timestamps and check the layout, without rendering")
+
+    return parser.parse_args(argv)
+
+
+def get_sanim_options(args):
+    """Get the command line options of sanim.py for every presentation."""
+    options = []
+    if args.low_quality:
+        options.append("-l")
+    if args.medium_quality:
+        options.append("-m")
+    if args.resolution:
+        options += ["-r", args.resolution]
+    if args.no_cache:
+        options.append("--no_cache")
+    if args.dry_run:
+        options.append("--dry_run")
+    return options
+
+
+def main(argv=None):
+    """
+    Main entry point function.
+
+    Args:
+        argv: Command line arguments, sys.argv[1:] by default
+
+    Returns:
+        Exit code
+    """
+    try:
+        args = parse_args(argv)
+        start_time = time.time()
+
+        presentation_files = find_presentation_files(args.paths)
+        if not presentation_files:
+            raise SanimParseError("No presentations found")
+
+        errors = compile_tex_requirements(presentation_files)
+        results = render_presentations(
+            [f for f in presentation_files if f not in errors],
+            get_sanim_options(args),
+            max(args.jobs, 1)
+        )
+
+        print_summary(presentation_files, results, errors, time.time() - start_time)
+        if errors or any(exit_code != 0 for exit_code, render_time in results.values()):
+            return 1
+        return 0
+
+    except SanimParseError as e:
+        print(f"Error parsing input: {str(e)}")
+        return 1
+    except SanimRenderError as e:
+        print(f"Error rendering presentation: {str(e)}")
+        return 1
+    except Exception as e:
+        import traceback
+        print(f"Unexpected error: {str(e)}")
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
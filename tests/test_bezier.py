@@ -0,0 +1,80 @@
+import numpy as np
+
+from manim_engine.constants import RIGHT, UP
+from manim_engine.mobject.geometry import Circle
+from manim_engine.mobject.types.vectorized_mobject import VMobject
+from manim_engine.utils.bezier import bezier
+from manim_engine.utils.bezier import partial_bezier_points
+
+
+# partial_bezier_points before it used de Casteljau's algorithm
+
+def old_partial_bezier_points(points, a, b):
+    a_to_1 = np.array([
+        bezier(points[i:])(a)
+        for i in range(len(points))
+    ])
+    return np.array([
+        bezier(a_to_1[:i + 1])((b - a) / (1. - a))
+        for i in range(len(points))
+    ])
+
+
+def get_intervals():
+    random = np.random.RandomState(0)
+    intervals = [(0, 1), (0, 0.4), (0.4, 1), (0.3, 0.3), (0, 0), (0.7, 0.9)]
+    for i in range(20):
+        a, b = sorted(random.uniform(0, 1, 2))
+        intervals.append((a, b))
+    return intervals
+
+
+def test_partial_bezier_points_matches_old_behavior():
+    random = np.random.RandomState(1)
+    for degree in range(1, 5):
+        points = random.normal(size=(degree + 1, 3))
+        for a, b in get_intervals():
+            assert np.allclose(
+                partial_bezier_points(points, a, b),
+                old_partial_bezier_points(points, a, b),
+                rtol=0, atol=1e-12
+            )
+
+
+def test_partial_bezier_points_is_exact_on_the_whole_curve():
+    points = np.random.RandomState(2).normal(size=(4, 3))
+    assert np.array_equal(partial_bezier_points(points, 0, 1), points)
+
+
+def test_partial_bezier_points_of_several_curves():
+    random = np.random.RandomState(3)
+    curves = random.normal(size=(10, 4, 3))
+    lower_alphas = random.uniform(0, 0.5, 10)
+    upper_alphas = random.uniform(0.5, 1, 10)
+    partials = partial_bezier_points(curves, lower_alphas, upper_alphas)
+    for curve, a, b, partial in zip(curves, lower_alphas, upper_alphas, partials):
+        assert np.array_equal(partial, partial_bezier_points(curve, a, b))
+
+
+def test_pointwise_become_partial_matches_old_behavior():
+    circle = Circle().shift(RIGHT + UP)
+    for a, b in get_intervals():
+        partial = VMobject().pointwise_become_partial(circle, a, b)
+        num_cubics = circle.get_num_anchor_points() - 1
+        lower_index = int(a * num_cubics)
+        upper_index = int(b * num_cubics)
+        expected = np.array(circle.points[3 * lower_index:3 * upper_index + 4])
+        if not (a <= 0 and b >= 1) and len(expected) > 1:
+            a_residue = (num_cubics * a) % 1
+            b_residue = (num_cubics * b) % 1
+            if b == 1:
+                b_residue = 1
+            elif lower_index == upper_index:
+                b_residue = (b_residue - a_residue) / (1 - a_residue)
+            expected[:4] = old_partial_bezier_points(expected[:4], a_residue, 1)
+            expected[-4:] = old_partial_bezier_points(expected[-4:], 0, b_residue)
+        assert partial.points.shape == expected.shape
+        assert np.allclose(partial.points, expected, rtol=0, atol=1e-12)
+    assert np.array_equal(
+        VMobject().pointwise_become_partial(circle, 0, 1).points, circle.points
+    )
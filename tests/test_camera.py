@@ -0,0 +1,118 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("cairo")
+
+from manim_engine.animation.creation import FadeIn, FadeOut
+from manim_engine.camera.camera import Camera
+from manim_engine.constants import BLUE, RED, RIGHT
+from manim_engine.mobject.geometry import Circle, Square
+from manim_engine.mobject.types.image_mobject import ImageMobject
+from manim_engine.mobject.types.vectorized_mobject import VGroup
+
+
+def get_image(opaque=True):
+    y, x = np.mgrid[0:20, 0:30]
+    pixels = np.stack([8 * x, 12 * y, 4 * (x + y), 255 - 6 * x - 2 * y], axis=2)
+    if opaque:
+        pixels[:, :, 3] = 255
+    return ImageMobject(pixels.astype("uint8"))
+
+
+def composite(camera, sprite):
+    background = np.zeros(sprite.shape, dtype="uint8")
+    background[:, :] = (30, 60, 90, 255)
+    camera.overlay_rgba_array(background, sprite)
+    return background.astype(int)
+
+
+@pytest.mark.parametrize("Animation", [FadeIn, FadeOut])
+@pytest.mark.parametrize("opaque", [True, False])
+def test_fades_reuse_the_image_sprite(Animation, opaque):
+    camera = Camera()
+    image = get_image(opaque)
+    animation = Animation(image)
+    for alpha in np.linspace(0, 1, 11):
+        animation.update(alpha)
+        sprite = camera.get_image_sprite(image, (60, 40), 10)
+        resized = camera.resize_image_array(image.get_pixel_array(), (60, 40), 10)
+        assert np.abs(sprite[:, :, 3].astype(int) - resized[:, :, 3]).max() <= 4
+        difference = composite(camera, sprite) - composite(camera, resized)
+        assert np.abs(difference).mean() < 1
+    assert len(camera.image_sprite_cache) == 1
+
+
+def test_image_sprite_follows_pixel_changes():
+    camera = Camera()
+    image = get_image()
+    sprite = camera.get_image_sprite(image, (60, 40), 0)
+    assert camera.get_image_sprite(image.copy(), (60, 40), 0) is sprite
+    for change in [
+        lambda: image.set_opacity(0.5),
+        lambda: image.set_color("#ff0000"),
+        lambda: image.fade(0.3),
+    ]:
+        change()
+        assert np.array_equal(
+            camera.get_image_sprite(image, (60, 40), 0),
+            camera.resize_image_array(image.get_pixel_array(), (60, 40), 0)
+        )
+
+
+def get_cameras():
+    sprite_camera = Camera(pixel_width=320, pixel_height=180)
+    camera = Camera(pixel_width=320, pixel_height=180, max_sprite_cache_bytes=0)
+    return sprite_camera, camera
+
+
+def get_pixel_size(camera):
+    return np.array([
+        camera.get_frame_width() / camera.get_pixel_width(),
+        camera.get_frame_height() / camera.get_pixel_height(),
+        0,
+    ])
+
+
+def capture(camera, mobject):
+    camera.reset()
+    camera.capture_mobject(mobject)
+    return np.array(camera.get_pixel_array(), dtype=int)
+
+
+def get_vmobject():
+    return VGroup(
+        Square().set_fill(BLUE, opacity=0.8),
+        Circle(color=RED).shift(RIGHT),
+    )
+
+
+def test_sprites_match_direct_drawing_after_whole_pixel_moves():
+    sprite_camera, camera = get_cameras()
+    vmobject = get_vmobject()
+    for n in range(5):
+        assert np.array_equal(
+            capture(sprite_camera, vmobject), capture(camera, vmobject)
+        )
+        vmobject.shift(get_pixel_size(camera) * [3, -2, 0])
+    entries = list(sprite_camera.sprite_cache.values())
+    assert len(entries) == 2
+    assert all(entry["sprite"] is not None for entry in entries)
+
+
+def test_sprites_after_sub_pixel_moves():
+    sprite_camera, camera = get_cameras()
+    vmobject = get_vmobject()
+    capture(sprite_camera, vmobject)
+    for n in range(5):
+        vmobject.shift(get_pixel_size(camera) * [2.3, 0.6, 0])
+        difference = capture(sprite_camera, vmobject) - capture(camera, vmobject)
+        assert np.abs(difference).mean() < 1
+    assert all(
+        entry["sprite"] is not None
+        for entry in sprite_camera.sprite_cache.values()
+    )
+    # Once it stops moving it is drawn exactly again
+    for n in range(3):
+        assert np.array_equal(
+            capture(sprite_camera, vmobject), capture(camera, vmobject)
+        )
@@ -0,0 +1,119 @@
+import operator as op
+from functools import reduce
+
+from manim_engine.animation.creation import Write
+from manim_engine.mobject.geometry import Arrow, Circle, Square
+from manim_engine.mobject.svg.tex_mobject import TexMobject
+from manim_engine.utils.config_ops import digest_config
+from manim_engine.utils.config_ops import filtered_locals
+
+
+# digest_config before CONFIGs were merged once per class
+
+def old_digest_config(obj, kwargs, caller_locals={}):
+    classes_in_hierarchy = [obj.__class__]
+    static_configs = []
+    while len(classes_in_hierarchy) > 0:
+        Class = classes_in_hierarchy.pop()
+        classes_in_hierarchy += Class.__bases__
+        if hasattr(Class, "CONFIG"):
+            static_configs.append(Class.CONFIG)
+    caller_locals = filtered_locals(caller_locals)
+    all_dicts = [kwargs, caller_locals, obj.__dict__]
+    all_dicts += static_configs
+    obj.__dict__ = old_merge_config(all_dicts)
+
+
+def old_merge_config(all_dicts):
+    all_config = reduce(op.add, [list(d.items()) for d in all_dicts])
+    config = dict()
+    for c in all_config:
+        key, value = c
+        if not key in config:
+            config[key] = value
+        else:
+            if isinstance(value, dict) and isinstance(config[key], dict):
+                config[key] = old_merge_config([config[key], value])
+    return config
+
+
+def assert_same_config(Class, kwargs={}, caller_locals={}, attrs={}):
+    new_obj = Class.__new__(Class)
+    new_obj.__dict__.update(attrs)
+    digest_config(new_obj, dict(kwargs), dict(caller_locals))
+    old_obj = Class.__new__(Class)
+    old_obj.__dict__.update(attrs)
+    old_digest_config(old_obj, dict(kwargs), dict(caller_locals))
+    assert list(new_obj.__dict__.items()) == list(old_obj.__dict__.items())
+    return new_obj
+
+
+class Base(object):
+    CONFIG = {
+        "a": 1,
+        "style": {"color": "red", "width": 2},
+        "only_base": {"x": 1},
+    }
+
+
+class Child(Base):
+    CONFIG = {
+        "a": 2,
+        "style": {"color": "blue"},
+        "b": [1, 2],
+    }
+
+
+class Mixin(object):
+    CONFIG = {
+        "style": {"opacity": 0.5},
+        "c": None,
+    }
+
+
+class GrandChild(Child, Mixin):
+    CONFIG = {
+        "b": [3],
+    }
+
+
+def test_digest_config_matches_old_behavior():
+    for Class in [Base, Child, GrandChild]:
+        assert_same_config(Class)
+        assert_same_config(Class, kwargs={"a": 5, "style": {"width": 7}})
+        assert_same_config(Class, caller_locals={"self": None, "c": 3, "style": 1})
+        assert_same_config(Class, kwargs={"style": {"color": "green"}}, attrs={"a": 0})
+    for Class, kwargs in [
+        (Square, {"side_length": 3}),
+        (Circle, {"color": "#ff0000"}),
+        (Arrow, {"tip_length": 0.1}),
+        (Write, {"run_time": 2}),
+        (TexMobject, {"tex_to_color_map": {"x": "#ff0000"}}),
+    ]:
+        assert_same_config(Class)
+        assert_same_config(Class, kwargs=kwargs)
+
+
+def test_merged_dicts_are_not_shared():
+    first = assert_same_config(GrandChild)
+    second = assert_same_config(GrandChild)
+    assert first.style == second.style
+    assert first.style is not second.style
+    first.style["color"] = "black"
+    assert assert_same_config(GrandChild).style["color"] == "blue"
+
+
+def test_config_changes_after_first_use():
+    class Changing(Child):
+        CONFIG = {"d": 1}
+
+    assert_same_config(Changing)
+    Changing.CONFIG = {"d": 2, "style": {"width": 9}}
+    assert assert_same_config(Changing).d == 2
+    Changing.CONFIG["e"] = 3
+    assert assert_same_config(Changing).e == 3
+    Child.CONFIG = dict(Child.CONFIG, a=4)
+    try:
+        assert assert_same_config(Changing).a == 4
+    finally:
+        Child.CONFIG = dict(Child.CONFIG, a=2)
@@ -0,0 +1,74 @@
+import numpy as np
+
+from manim_engine.constants import DOWN, LEFT, ORIGIN, RIGHT, UP
+from manim_engine.mobject.geometry import Circle, Square
+from manim_engine.mobject.types.vectorized_mobject import VGroup
+
+
+def get_uncached_corners(mobject):
+    points = np.concatenate([mob.points for mob in mobject.submobject_family()])
+    return points.min(0), points.max(0)
+
+
+def assert_bounding_box_is_current(mobject):
+    lower, upper = mobject.get_family_bounding_box()
+    expected_lower, expected_upper = get_uncached_corners(mobject)
+    assert np.allclose(lower, expected_lower)
+    assert np.allclose(upper, expected_upper)
+
+
+def test_bounding_box_follows_changes_to_the_points():
+    square = Square()
+    group = VGroup(square, Circle())
+    assert_bounding_box_is_current(group)
+    square.shift(3 * RIGHT)
+    assert_bounding_box_is_current(group)
+    square.apply_function(lambda point: point + np.array([0, point[0], 0]))
+    assert_bounding_box_is_current(group)
+    square.pointwise_become_partial(Square().shift(5 * UP), 0, 0.3)
+    assert_bounding_box_is_current(group)
+    square.points[0] = 10 * LEFT
+    square.note_geometry_change()
+    assert_bounding_box_is_current(group)
+
+
+def test_bounding_box_follows_added_and_removed_submobjects():
+    group = VGroup(Square())
+    assert_bounding_box_is_current(group)
+    far_square = Square().shift(8 * DOWN)
+    group.add(far_square)
+    assert_bounding_box_is_current(group)
+    group.remove(far_square)
+    assert_bounding_box_is_current(group)
+    far_square.shift(UP)
+    assert_bounding_box_is_current(group)
+
+
+def test_bounding_box_follows_changes_below_shared_parents():
+    child = Square()
+    parent = VGroup(child)
+    first = VGroup(parent, Circle())
+    second = VGroup(parent)
+    for group in [first, second, parent]:
+        assert_bounding_box_is_current(group)
+    child.shift(4 * UP)
+    for group in [first, second, parent]:
+        assert_bounding_box_is_current(group)
+
+
+def test_bounding_box_of_copies():
+    group = VGroup(VGroup(Square()), Circle())
+    assert_bounding_box_is_current(group)
+    for group_copy in [group.copy(), group.deepcopy()]:
+        assert_bounding_box_is_current(group_copy)
+        group_copy.submobjects[0].submobjects[0].shift(6 * RIGHT)
+        assert_bounding_box_is_current(group_copy)
+    assert_bounding_box_is_current(group)
+
+
+def test_bounding_box_of_empty_family():
+    group = VGroup()
+    assert group.get_family_bounding_box() is None
+    assert np.allclose(group.get_center(), ORIGIN)
+    group.add(Square().shift(RIGHT))
+    assert_bounding_box_is_current(group)
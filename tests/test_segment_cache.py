@@ -0,0 +1,242 @@
+import json
+import os
+import shutil
+import subprocess as sp
+import types
+
+import numpy as np
+import pytest
+
+from manim_engine.constants import LOW_QUALITY_CAMERA_CONFIG
+from manim_engine.constants import LOW_QUALITY_FRAME_DURATION
+from manim_engine.constants import RIGHT, UP
+from manim_engine.mobject.geometry import Circle, Square
+from manim_engine.mobject.types.image_mobject import ImageMobject
+from util.positioning import get_layout_proxy
+from util.segment_cache import FINGERPRINT_LENGTH
+from util.segment_cache import SEGMENT_CACHE_VERSION
+from util.segment_cache import SegmentCache
+
+
+class FakeCamera(object):
+    def __init__(self, pixel_width):
+        self.pixel_width = pixel_width
+
+    def get_pixel_width(self):
+        return self.pixel_width
+
+    def get_pixel_height(self):
+        return 480
+
+
+def get_scene(mobjects=(), pixel_width=854):
+    return types.SimpleNamespace(
+        movie_file_extension=".mp4",
+        camera=FakeCamera(pixel_width),
+        camera_config={"background_color": "#000000"},
+        frame_duration=LOW_QUALITY_FRAME_DURATION,
+        get_mobject_family_members=lambda: [
+            sm for m in mobjects for sm in m.submobject_family()
+        ],
+    )
+
+
+def get_image(value=0):
+    return ImageMobject(np.full((4, 6, 4), value, dtype="uint8"))
+
+
+class Segment(object):
+    """
+    What get_fingerprint is given for a segment, which tests change one
+    piece at a time.
+    """
+
+    def __init__(self):
+        self.on_screen_mobjects = [Square()]
+        self.position = get_layout_proxy(Square()).shift(UP)
+        self.on_screen_sources = ["TITLE Intro"]
+        self.segment_sources = ["- $x^2$", "IMAGE cat.png"]
+        self.segment_mobjects = [Circle(), get_image()]
+
+    def get_fingerprint(self, cache):
+        return cache.get_fingerprint(
+            get_scene(self.on_screen_mobjects),
+            self.position,
+            self.on_screen_sources,
+            self.segment_sources,
+            self.segment_mobjects,
+        )
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return SegmentCache(str(tmp_path), get_scene())
+
+
+def test_fingerprint_is_stable(tmp_path, cache):
+    fingerprint = Segment().get_fingerprint(cache)
+    assert len(fingerprint) == FINGERPRINT_LENGTH
+    assert Segment().get_fingerprint(cache) == fingerprint
+    other_cache = SegmentCache(str(tmp_path), get_scene())
+    assert Segment().get_fingerprint(other_cache) == fingerprint
+
+
+def test_fingerprint_follows_content(cache):
+    fingerprint = Segment().get_fingerprint(cache)
+    changes = [
+        # The TeX of a line, and so its mobjects
+        lambda s: s.segment_mobjects[0].stretch(1.1, 0),
+        lambda s: s.segment_mobjects[0].set_color("#ff0000"),
+        # The pixels of an image
+        lambda s: s.segment_mobjects[1].set_opacity(0.5),
+        lambda s: setattr(s.segment_mobjects[1], "pixel_array", get_image(1).pixel_array),
+        # The source of a line
+        lambda s: s.segment_sources.append("- More"),
+        # What is on screen when the segment starts
+        lambda s: s.on_screen_sources.append("- Earlier"),
+        lambda s: s.on_screen_mobjects[0].shift(RIGHT),
+        lambda s: s.on_screen_mobjects.append(get_image()),
+        lambda s: s.position.shift(RIGHT),
+    ]
+    fingerprints = {fingerprint}
+    for change in changes:
+        segment = Segment()
+        change(segment)
+        fingerprints.add(segment.get_fingerprint(cache))
+    assert len(fingerprints) == len(changes) + 1
+
+
+def test_fingerprint_follows_render_settings(tmp_path, cache):
+    other_cache = SegmentCache(str(tmp_path), get_scene(pixel_width=1920))
+    assert Segment().get_fingerprint(other_cache) != Segment().get_fingerprint(cache)
+
+
+def test_store_and_load(cache):
+    fingerprint = Segment().get_fingerprint(cache)
+    assert cache.load(fingerprint) is None
+    cache.store(fingerprint, 2.5, [0.1, 1.2])
+    # Segments are only loaded once their video file exists
+    assert cache.load(fingerprint) is None
+    open(cache.get_movie_file_path(fingerprint), "w").close()
+    info = cache.load(fingerprint)
+    assert info["duration"] == 2.5
+    assert info["time_stamps"] == [0.1, 1.2]
+    cache.reuse_cached_segments = False
+    assert cache.load(fingerprint) is None
+
+
+def add_segment(cache, fingerprint, info=None):
+    open(cache.get_movie_file_path(fingerprint), "w").close()
+    if info is None:
+        cache.store(fingerprint, 1.0, [])
+    else:
+        with open(cache.get_info_file_path(fingerprint), "w") as f:
+            json.dump(info, f)
+
+
+def test_prune_removes_only_stale_segments(tmp_path, cache):
+    used = Segment().get_fingerprint(cache)
+    add_segment(cache, used)
+    stale = "1" * FINGERPRINT_LENGTH
+    add_segment(cache, stale)
+    # Left behind by a render that was interrupted
+    interrupted = "2" * FINGERPRINT_LENGTH
+    open(os.path.join(cache.directory, interrupted + "Temp.mp4"), "w").close()
+    old_version = "3" * FINGERPRINT_LENGTH
+    add_segment(cache, old_version, {
+        "duration": 1.0, "time_stamps": [], "version": SEGMENT_CACHE_VERSION - 1,
+    })
+    # Rendered at another quality
+    other_config = "4" * FINGERPRINT_LENGTH
+    other_cache = SegmentCache(str(tmp_path), get_scene(pixel_width=1920))
+    add_segment(other_cache, other_config)
+
+    cache.prune()
+    assert sorted(os.listdir(cache.directory)) == sorted([
+        used + ".mp4", used + ".json",
+        other_config + ".mp4", other_config + ".json",
+    ])
+
+
+# Rendering decks end to end
+
+requires_renderer = pytest.mark.skipif(
+    shutil.which("latex") is None or shutil.which("dvisvgm") is None or
+    shutil.which("ffmpeg") is None,
+    reason="needs latex, dvisvgm and ffmpeg"
+)
+
+DECK = [
+    "TITLE Segments",
+    "- First point",
+    "FLUSH",
+    "- Second point",
+    "- Third point",
+    "FLUSH",
+    "- Last point",
+]
+
+
+def render_deck(deck_dir, lines, **kwargs):
+    pytest.importorskip("cairo")
+    from sanim import Sanim
+    from sanim import get_uncached_fingerprints
+
+    source_file = os.path.join(str(deck_dir), "deck.txt")
+    with open(source_file, "w") as f:
+        f.write("\n".join(lines) + "\n")
+    scene_kwargs = dict(
+        sanim_source_file=source_file,
+        camera_config=LOW_QUALITY_CAMERA_CONFIG,
+        frame_duration=LOW_QUALITY_FRAME_DURATION,
+        write_to_movie=True,
+        movie_file_extension=".mp4",
+        **kwargs
+    )
+    uncached_fingerprints = get_uncached_fingerprints(scene_kwargs)
+    scene = Sanim(**scene_kwargs)
+    return uncached_fingerprints, scene.get_movie_file_path()
+
+
+def get_frame_hashes(movie_file_path):
+    output = sp.check_output([
+        "ffmpeg", "-loglevel", "error", "-i", movie_file_path,
+        "-f", "framemd5", "-",
+    ]).decode()
+    return [
+        line.split(",")[-1].strip()
+        for line in output.splitlines()
+        if line and not line.startswith("#")
+    ]
+
+
+@requires_renderer
+def test_edits_only_change_the_segments_they_show_in(tmp_path):
+    fingerprints = render_deck(tmp_path, DECK)[0]
+    assert len(fingerprints) == 3
+    assert render_deck(tmp_path, DECK)[0] == []
+    # The last segment starts with the second slide on screen
+    edited_last = DECK[:-1] + ["- Last point, edited"]
+    new_fingerprints = render_deck(tmp_path, edited_last)[0]
+    assert len(new_fingerprints) == 1
+    assert new_fingerprints[0] not in fingerprints
+    edited_second = DECK[:3] + ["- Second point, edited"] + DECK[4:]
+    assert len(render_deck(tmp_path, edited_second)[0]) == 2
+
+
+@requires_renderer
+def test_cached_and_rendered_segments_make_the_same_movie(tmp_path):
+    cached_dir = tmp_path / "cached"
+    fresh_dir = tmp_path / "fresh"
+    cached_dir.mkdir()
+    fresh_dir.mkdir()
+    edited = DECK[:3] + ["- Second point, edited"] + DECK[4:]
+    render_deck(cached_dir, DECK)
+    uncached_fingerprints, movie_file_path = render_deck(cached_dir, edited)
+    assert len(uncached_fingerprints) == 2
+    fresh_movie_file_path = render_deck(
+        fresh_dir, edited, reuse_cached_segments=False
+    )[1]
+    frame_hashes = get_frame_hashes(movie_file_path)
+    assert len(frame_hashes) > 0
+    assert frame_hashes == get_frame_hashes(fresh_movie_file_path)
@@ -0,0 +1,62 @@
+import os
+import shutil
+
+import numpy as np
+import pytest
+
+import manim_engine.utils.tex_file_writing as tex_file_writing
+from manim_engine.constants import TEMPLATE_TEX_FILE_BODY
+from manim_engine.mobject.svg.svg_mobject import SVGMobject
+
+requires_latex = pytest.mark.skipif(
+    shutil.which("latex") is None or shutil.which("dvisvgm") is None,
+    reason="needs latex and dvisvgm"
+)
+
+
+@pytest.fixture
+def tex_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(tex_file_writing, "TEX_DIR", str(tmp_path))
+    return tmp_path
+
+
+def get_svg_points(file_path):
+    # Centered like TeX mobjects, so only the shapes and their
+    # relative positions and sizes are compared
+    svg = SVGMobject(file_name=file_path, should_center=True, height=None)
+    return np.concatenate([
+        mob.points for mob in svg.family_members_with_points()
+    ])
+
+
+@requires_latex
+def test_batched_svg_matches_svg_compiled_alone(tex_dir):
+    expressions = ["x^2 + y^2", "\\frac{a}{b}", "\\sum_{i=1}^n i"]
+    batch_body = tex_file_writing.get_batch_template_tex_file_body(
+        expressions, TEMPLATE_TEX_FILE_BODY
+    )
+    assert tex_file_writing.batch_tex_to_svg_files(
+        batch_body, expressions, TEMPLATE_TEX_FILE_BODY
+    )
+    for expression in expressions:
+        svg_file = tex_file_writing.get_svg_file_path(
+            expression, TEMPLATE_TEX_FILE_BODY
+        )
+        batched_points = get_svg_points(svg_file)
+        os.remove(svg_file)
+        alone_points = get_svg_points(tex_file_writing.tex_to_svg_file(
+            expression, TEMPLATE_TEX_FILE_BODY
+        ))
+        assert batched_points.shape == alone_points.shape
+        assert np.allclose(batched_points, alone_points)
+
+
+def test_failed_batch_leaves_no_files(tex_dir):
+    expressions = ["x", "\\undefinedcommand"]
+    batch_body = tex_file_writing.get_batch_template_tex_file_body(
+        expressions, TEMPLATE_TEX_FILE_BODY
+    )
+    assert not tex_file_writing.batch_tex_to_svg_files(
+        batch_body, expressions, TEMPLATE_TEX_FILE_BODY
+    )
+    assert os.listdir(str(tex_dir)) == []
@@ -19,6 +19,32 @@ class InputParser:
         """
         Parse a file into a list of InputLine objects.
         
+        Args:
+            file_path: Path to the input file
+            
+        Returns:
+            List of InputLine objects
+            
+        Raises:
+            SanimParseError: If there's an error parsing the file
+        """
+        result = InputParser.read_file(file_path)
+        try:
+            # Compile all the TeX up front, in parallel, so that building
+            # the output elements only reads from the cache
+            InputParser.compile_tex_requirements(result)
+            for line in result:
+                line.build_output_elements()
+            return result
+        except Exception as e:
+            raise SanimParseError(f"Error parsing file {file_path}: {str(e)}")
+    
+    @staticmethod
+    def read_file(file_path):
+        """
+        Read a file into a list of InputLine objects, without building
+        their output elements.
+        
         Args:
             file_path: Path to the input file
             
@@ -39,6 +65,36 @@ class InputParser:
             return result
         except Exception as e:
             raise SanimParseError(f"Error parsing file {file_path}: {str(e)}")
+    
+    @staticmethod
+    def get_tex_requirements(lines):
+        """
+        Get every TeX file needed to build the given lines.
+        
+        Args:
+            lines: List of InputLine objects
+            
+        Returns:
+            List of (expression, template_tex_file_body) pairs
+        """
+        from util.positioning import ElementPosition
+        
+        requirements = ElementPosition.get_tex_requirements()
+        for line in lines:
+            requirements += line.get_tex_requirements()
+        return requirements
+    
+    @staticmethod
+    def compile_tex_requirements(lines):
+        """
+        Compile every TeX file needed to build the given lines.
+        
+        Args:
+            lines: List of InputLine objects
+        """
+        from manim_engine.utils.tex_file_writing import tex_to_svg_files
+        
+        tex_to_svg_files(InputParser.get_tex_requirements(lines))
 
 
 class InputElement:
@@ -124,6 +180,8 @@ class InputLine:
         """
         Initialize a new InputLine from raw text.
         
+        The output elements are not built until build_output_elements is called.
+        
         Args:
             line_num: Line number in the source file
             raw_content: Raw text content from the input file
@@ -134,26 +192,46 @@ class InputLine:
         # Split by semicolons
         self.raw_input_elements = raw_content.split(';')
         self.input_elements = [InputElement(elem) for elem in self.raw_input_elements]
-        
+        self.output_elements = []
+    
+    @staticmethod
+    def get_output_element_classes():
+        """Get the output element class for each content keyword."""
         # Import element classes here to avoid circular imports
         from elements.text import TitleElement, PlainTextElement, BulletElement, DefinitionElement, TermElement
         from elements.media import ImageElement
         
-        # Convert input elements to output elements
-        self.output_elements = []
+        return {
+            "TITLE": TitleElement,
+            "PLAIN": PlainTextElement,
+            "-": BulletElement,
+            "DEF": DefinitionElement,
+            "IMAGE": ImageElement,
+            "TERM": TermElement,
+        }
+    
+    def get_tex_requirements(self):
+        """
+        Get the TeX files the output elements of this line will compile.
+        
+        Returns:
+            List of (expression, template_tex_file_body) pairs
+        """
+        element_classes = self.get_output_element_classes()
+        result = []
         for elem in self.input_elements:
-            if elem.keyword == "TITLE":
-                self.output_elements.append(TitleElement(elem))
-            elif elem.keyword == "PLAIN":
-                self.output_elements.append(PlainTextElement(elem))
-            elif elem.keyword == "-":
-                self.output_elements.append(BulletElement(elem))
-            elif elem.keyword == "DEF":
-                self.output_elements.append(DefinitionElement(elem))
-            elif elem.keyword == "IMAGE":
-                self.output_elements.append(ImageElement(elem))
-            elif elem.keyword == "TERM":
-                self.output_elements.append(TermElement(elem))
+            if elem.keyword in element_classes:
+                result += element_classes[elem.keyword].get_tex_requirements(elem)
+        return result
+    
+    def build_output_elements(self):
+        """Convert the input elements of this line to output elements."""
+        element_classes = self.get_output_element_classes()
+        self.output_elements = [
+            element_classes[elem.keyword](elem)
+            for elem in self.input_elements
+            if elem.keyword in element_classes
+        ]
     
     def is_content_line(self):
         """Check if this line contains content elements."""
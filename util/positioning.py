@@ -1,17 +1,52 @@
-from manim_engine.big_ol_pile_of_manim_imports import TextMobject, TOP, LEFT, MED_SMALL_BUFF, DOWN
+import numpy as np
+
+from manim_engine.constants import TOP, LEFT, MED_SMALL_BUFF, DOWN
+from manim_engine.mobject.mobject import Mobject
+from manim_engine.mobject.svg.tex_mobject import TextMobject, get_tex_file_requirements
+
+def get_layout_proxy(mobject):
+    """
+    Get a stand-in for a mobject, for computing layout.
+    
+    The proxy only has the two extreme corners of the mobject's bounding box
+    as points, so moving and aligning it gives the same results as doing it
+    to the mobject, for a fraction of the cost of copying it.
+    
+    Args:
+        mobject: The mobject to stand in for
+        
+    Returns:
+        Mobject with the same bounding box, or with no points if the
+        mobject has none
+    """
+    bounding_box = mobject.get_family_bounding_box()
+    proxy = Mobject()
+    if bounding_box is not None:
+        proxy.points = np.array(bounding_box)
+    return proxy
 
 class ElementPosition:
     """
     Manages the position of elements in the presentation.
     """
     
+    # Auxiliary object used only for positioning, built once
+    aux_mobject = None
+    
     def __init__(self):
         """Initialize a new position tracker at the top-left corner."""
         self.position = self._get_top_left_position()
     
+    @staticmethod
+    def get_tex_requirements():
+        """Get the TeX files compiled by the auxiliary positioning mobject."""
+        return get_tex_file_requirements(TextMobject, "aux")
+    
     def _get_top_left_position(self):
         """Create a mobject positioned at the top-left corner of the screen."""
-        position = TextMobject("aux")  # Auxiliary object used only for positioning
+        if ElementPosition.aux_mobject is None:
+            ElementPosition.aux_mobject = TextMobject("aux")
+        position = get_layout_proxy(ElementPosition.aux_mobject)
         position.to_corner(TOP+LEFT, buff=MED_SMALL_BUFF)
         return position
     
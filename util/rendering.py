@@ -78,16 +78,30 @@ class PresentationRenderer:
     Renders a presentation from InputLines.
     """
     
-    def __init__(self, scene):
+    def __init__(self, scene, segment_cache=None, fingerprints_to_render=None):
         """
         Initialize a new presentation renderer.
         
         Args:
             scene: The scene to render in
+            segment_cache: Optional SegmentCache. If given, the movie is written
+                in segments delimited by FLUSH commands, and unchanged segments
+                are reused from the cache instead of rendered
+            fingerprints_to_render: Optional container of segment fingerprints.
+                If given, only the uncached segments with those fingerprints are
+                rendered into the cache, and the others are just played in skip
+                mode to keep the layout up to date
         """
         self.scene = scene
         self.position = ElementPosition()
         self.animation_buffer = AnimationBuffer(scene)
+        self.segment_cache = segment_cache
+        self.fingerprints_to_render = fingerprints_to_render
+        self.segment = None
+        # Fingerprints of the segments that were not in the cache
+        self.uncached_fingerprints = []
+        self.slides = []
+        self.layout_warnings = []
     
     def render_line(self, line):
         """
@@ -102,6 +116,7 @@ class PresentationRenderer:
             # Single element - left aligned
             element = elements[0]
             element.position_left_aligned(self.position.get_current_position())
+            self.check_layout(line, element)
             self.position.update_after_element(element)
             self.animation_buffer.add_element(element)
         else:
@@ -116,11 +131,50 @@ class PresentationRenderer:
                 
                 # Position and animate the element
                 element.position_center_at(position)
+                self.check_layout(line, element)
                 self.animation_buffer.add_element(element)
             
             # Update position to the bottom of the last element
             self.position.update_after_element(elements[-1])
     
+    def check_layout(self, line, element):
+        """
+        Record a warning if a positioned element does not fit in the frame.
+        
+        Args:
+            line: The line of the element
+            element: The element, already positioned
+        """
+        overflows = []
+        for mobject in element.get_mobjects():
+            overflows.extend([
+                ("bottom", -FRAME_Y_RADIUS - mobject.get_bottom()[1]),
+                ("right", mobject.get_right()[0] - FRAME_X_RADIUS),
+                ("left", -FRAME_X_RADIUS - mobject.get_left()[0]),
+            ])
+        for edge, overflow in overflows:
+            if overflow > 1e-3:
+                self.layout_warnings.append(
+                    f"Line {line.line_num} at {self.scene.current_scene_time:.2f}s: "
+                    f"extends {overflow:.2f} units past the {edge} of the frame"
+                )
+                return
+    
+    def get_slide_durations(self):
+        """
+        Get the timing of each slide, the part of the presentation between
+        two FLUSH commands.
+        
+        Returns:
+            List of (line number, start time, duration) tuples, in seconds
+        """
+        end_times = [slide["start_time"] for slide in self.slides[1:]]
+        end_times.append(self.scene.current_scene_time)
+        return [
+            (slide["line_num"], slide["start_time"], end_time - slide["start_time"])
+            for slide, end_time in zip(self.slides, end_times)
+        ]
+    
     def get_shift_actions(self, line, position):
         """
         Get animations to shift elements in a line to a new position.
@@ -144,7 +198,7 @@ class PresentationRenderer:
             result.extend(element.get_shift_left_aligned_actions(position))
             
             # Update position
-            element_copy = element.copy()
+            element_copy = element.get_layout_copy()
             element_copy.position_left_aligned(position)
             position.move_to(element_copy.get_bottom_position().get_edge_center(DOWN))
         else:
@@ -161,7 +215,7 @@ class PresentationRenderer:
                 result.extend(element.get_shift_center_at_actions(elem_position))
             
             # Update position
-            element_copy = elements[-1].copy()
+            element_copy = elements[-1].get_layout_copy()
             element_copy.position_center_at(elem_position)
             position.move_to(element_copy.get_bottom_position().get_edge_center(DOWN))
         
@@ -180,12 +234,14 @@ class PresentationRenderer:
             List of timestamps for the web player
         """
         flush_index = 0  # Starting line to flush when using FLUSH
+        self.begin_segment(lines, 0, flush_index)
+        self.begin_slide(lines[0].line_num if lines else 1)
         
         # Initial wait
         self.scene.wait(ELEMENT_DISPLAY_WAIT_TIME)
         self.animation_buffer.time_stamps = [ELEMENT_DISPLAY_WAIT_TIME / 2]  # Initial timestamp
         
-        for line in lines:
+        for line_index, line in enumerate(lines):
             if line.is_content_line():
                 # Render content line
                 self.render_line(line)
@@ -201,15 +257,11 @@ class PresentationRenderer:
                 if element.keyword == 'FLUSH':
                     # Flush command
                     self.animation_buffer.flush()  # Flush any leftover animations
+                    self.end_segment()
+                    self.begin_segment(lines, line_index, flush_index)
+                    self.begin_slide(line.line_num)
                     
-                    # Parse flush line number (if empty, use the current line)
-                    try:
-                        if element.content.strip():
-                            flush_line_num = int(element.content)
-                        else:
-                            flush_line_num = line.line_num
-                    except ValueError:
-                        raise SanimParseError(f"Invalid flush line number: {element.content}")
+                    flush_line_num = get_flush_line_num(line)
                     
                     current_line_num = line.line_num
                     if flush_line_num > current_line_num:
@@ -251,6 +303,147 @@ class PresentationRenderer:
         
         # Flush any remaining animations
         self.animation_buffer.flush()
+        self.end_segment()
         
         return self.animation_buffer.get_time_stamps()
+    
+    def begin_slide(self, line_num):
+        """
+        Record the start of a slide.
+        
+        Args:
+            line_num: Line number where the slide starts
+        """
+        self.slides.append({
+            "line_num": line_num,
+            "start_time": self.scene.current_scene_time,
+        })
+    
+    def begin_segment(self, lines, start_index, flush_index):
+        """
+        Start the segment of the movie that begins at the given line.
+        
+        The segment ends right before the next FLUSH command. If it is cached,
+        it is played in skip mode, which only updates the mobjects.
+        
+        Args:
+            lines: List of all input lines
+            start_index: Index of the first line of the segment
+            flush_index: Index of the first line on screen
+        """
+        if self.segment_cache is None:
+            return
+        end_index = start_index
+        if start_index < len(lines) and is_flush_line(lines[start_index]):
+            end_index += 1
+        while end_index < len(lines) and not is_flush_line(lines[end_index]):
+            end_index += 1
+        
+        on_screen_lines = lines[flush_index:start_index]
+        segment_sources = []
+        segment_mobjects = []
+        for line in lines[start_index:end_index]:
+            if is_flush_line(line):
+                # Describe the flush by the number of lines it removes
+                try:
+                    flush_line_num = get_flush_line_num(line)
+                    num_flushed = len([l for l in on_screen_lines if l.line_num < flush_line_num])
+                    segment_sources.append(f"FLUSH {num_flushed} of {len(on_screen_lines)}")
+                except SanimParseError:
+                    segment_sources.append(line.raw_content)
+            else:
+                segment_sources.append(line.raw_content)
+            for element in line.output_elements:
+                segment_mobjects.extend(element.get_mobjects())
+        
+        fingerprint = self.segment_cache.get_fingerprint(
+            self.scene,
+            self.position.get_current_position(),
+            [line.raw_content for line in on_screen_lines],
+            segment_sources,
+            segment_mobjects,
+        )
+        cached = self.segment_cache.load(fingerprint)
+        self.segment = {
+            "fingerprint": fingerprint,
+            "cached": cached,
+            "rendered": cached is None and (
+                self.fingerprints_to_render is None or
+                fingerprint in self.fingerprints_to_render
+            ),
+            "start_time": self.scene.current_scene_time,
+            "num_time_stamps": len(self.animation_buffer.time_stamps),
+        }
+        if cached is None:
+            self.uncached_fingerprints.append(fingerprint)
+        if self.segment["rendered"]:
+            self.scene.begin_movie_segment(self.segment_cache.get_movie_file_path(fingerprint))
+        else:
+            self.scene.force_skipping()
+    
+    def end_segment(self):
+        """
+        End the current segment, storing it in the cache if it was rendered.
+        """
+        if self.segment is None:
+            return
+        fingerprint = self.segment["fingerprint"]
+        cached = self.segment["cached"]
+        start_time = self.segment["start_time"]
+        time_stamps = self.animation_buffer.time_stamps
+        num_time_stamps = self.segment["num_time_stamps"]
+        
+        if self.segment["rendered"]:
+            self.scene.close_movie_segment()
+            self.segment_cache.store(
+                fingerprint,
+                self.scene.current_scene_time - start_time,
+                [t - start_time for t in time_stamps[num_time_stamps:]],
+            )
+        else:
+            self.scene.revert_to_original_skipping_status()
+            if cached is not None:
+                # Skip mode doesn't advance the time, so use the cached timing
+                self.scene.current_scene_time = start_time + cached["duration"]
+                time_stamps[num_time_stamps:] = [start_time + t for t in cached["time_stamps"]]
+                self.scene.add_movie_segment(self.segment_cache.get_movie_file_path(fingerprint))
+        self.segment = None
+
+
+def is_flush_line(line):
+    """
+    Check if a line is a FLUSH command.
+    
+    Args:
+        line: The line to check
+        
+    Returns:
+        True if the line is a FLUSH command
+    """
+    if line.is_content_line():
+        return False
+    elements = line.input_elements
+    return len(elements) == 1 and elements[0].keyword == 'FLUSH'
+
+
+def get_flush_line_num(line):
+    """
+    Get the line number a FLUSH command flushes up to.
+    
+    Args:
+        line: The FLUSH line
+        
+    Returns:
+        The line number given in the command, or the line's own number if none is given
+        
+    Raises:
+        SanimParseError: If the line number is invalid
+    """
+    element = line.input_elements[0]
+    try:
+        if element.content.strip():
+            return int(element.content)
+        return line.line_num
+    except ValueError:
+        raise SanimParseError(f"Invalid flush line number: {element.content}")
 
@@ -0,0 +1,175 @@
+"""
+Cache of rendered presentation segments for Sanim.
+
+A segment is the part of the video between two FLUSH commands. Its
+fingerprint covers everything that can change its frames: the render
+settings, what is on screen when it starts, and its source lines.
+Unchanged segments are reused instead of rendered again.
+"""
+
+import os
+import json
+import hashlib
+
+import numpy as np
+
+SEGMENT_CACHE_DIR = "segment_cache_AUTOGENERATED"
+
+# Bump whenever a change to Sanim alters the rendered frames, so that
+# previously cached segments are not reused
+SEGMENT_CACHE_VERSION = 6
+
+# Number of hex digits of a fingerprint, which start the names of all
+# the files of its segment
+FINGERPRINT_LENGTH = 32
+
+
+class SegmentCache:
+    """
+    Stores rendered segments as video files in a folder next to the source.
+
+    Each segment is saved as <fingerprint><extension> along with
+    <fingerprint>.json, which holds its duration, the timestamps
+    recorded in it, relative to its start, and the settings it was
+    rendered with.
+    """
+
+    def __init__(self, source_folder, scene, reuse_cached_segments=True):
+        """
+        Initialize a new segment cache.
+
+        Args:
+            source_folder: Folder of the presentation source file
+            scene: The scene the segments are rendered in
+            reuse_cached_segments: If False, every segment is rendered
+                again, replacing the cached one
+        """
+        self.directory = os.path.join(source_folder, SEGMENT_CACHE_DIR)
+        self.reuse_cached_segments = reuse_cached_segments
+        os.makedirs(self.directory, exist_ok=True)
+        self.extension = scene.movie_file_extension
+        self.used_fingerprints = set()
+        self.config_fingerprint = repr([
+            SEGMENT_CACHE_VERSION,
+            scene.camera.get_pixel_width(),
+            scene.camera.get_pixel_height(),
+            str(scene.camera_config.get("background_color")),
+            scene.camera_config.get("background_opacity"),
+            scene.frame_duration,
+            scene.movie_file_extension,
+        ])
+
+    def get_fingerprint(self, scene, position, on_screen_sources, segment_sources, segment_mobjects):
+        """
+        Get the fingerprint of a segment about to be rendered.
+
+        Args:
+            scene: The scene, in the state the segment starts from
+            position: Position mobject where the next line will be placed
+            on_screen_sources: Source of the lines displayed when the segment starts
+            segment_sources: Source of the lines of the segment, with FLUSH
+                lines normalized so that they don't depend on line numbers
+            segment_mobjects: Mobjects of the elements of the segment,
+                not yet positioned
+
+        Returns:
+            Hex string identifying the segment
+        """
+        hasher = hashlib.sha256()
+        hasher.update(self.config_fingerprint.encode())
+        for source in on_screen_sources + ["---"] + segment_sources:
+            hasher.update(source.encode() + b"\n")
+        mobjects = scene.get_mobject_family_members() + [position]
+        for mobject in mobjects + [sm for m in segment_mobjects for sm in m.submobject_family()]:
+            hasher.update(type(mobject).__name__.encode())
+            hasher.update(np.round(mobject.points, 6).tobytes())
+            for attr in ["fill_rgbas", "stroke_rgbas", "background_stroke_rgbas", "pixel_array"]:
+                if hasattr(mobject, attr):
+                    hasher.update(np.asarray(getattr(mobject, attr)).tobytes())
+        fingerprint = hasher.hexdigest()[:FINGERPRINT_LENGTH]
+        self.used_fingerprints.add(fingerprint)
+        return fingerprint
+
+    def get_movie_file_path(self, fingerprint):
+        """Get the path of the video file of a segment."""
+        return os.path.join(self.directory, fingerprint + self.extension)
+
+    def get_info_file_path(self, fingerprint):
+        """Get the path of the duration and timestamps file of a segment."""
+        return os.path.join(self.directory, fingerprint + ".json")
+
+    def load(self, fingerprint):
+        """
+        Look up a segment.
+
+        Args:
+            fingerprint: Fingerprint of the segment
+
+        Returns:
+            Dict with the segment's "duration" and relative "time_stamps",
+            or None if the segment is not cached
+        """
+        if not self.reuse_cached_segments:
+            return None
+        if not os.path.exists(self.get_movie_file_path(fingerprint)):
+            return None
+        try:
+            with open(self.get_info_file_path(fingerprint), 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def store(self, fingerprint, duration, time_stamps):
+        """
+        Record a segment whose video file has been written.
+
+        The info file is written last, so a segment is never loaded
+        before its video file is complete.
+
+        Args:
+            fingerprint: Fingerprint of the segment
+            duration: Duration of the segment in seconds
+            time_stamps: Timestamps recorded in the segment, relative to its start
+        """
+        info_file = self.get_info_file_path(fingerprint)
+        temp_file = "%s.%d.tmp" % (info_file, os.getpid())
+        with open(temp_file, 'w') as f:
+            json.dump({
+                "duration": duration,
+                "time_stamps": time_stamps,
+                "version": SEGMENT_CACHE_VERSION,
+                "config": self.config_fingerprint,
+            }, f)
+        os.replace(temp_file, info_file)
+
+    def prune(self):
+        """
+        Remove the segments whose fingerprint was not computed since
+        this cache was created, so only call it once every segment of
+        the presentation has been looked up.
+
+        Segments rendered with other settings, like another quality, are
+        kept, unless they come from another SEGMENT_CACHE_VERSION.
+        """
+        file_names = {}
+        for file_name in os.listdir(self.directory):
+            fingerprint = file_name[:FINGERPRINT_LENGTH]
+            file_names.setdefault(fingerprint, []).append(file_name)
+        for fingerprint, names in file_names.items():
+            if fingerprint in self.used_fingerprints:
+                continue
+            try:
+                with open(self.get_info_file_path(fingerprint), 'r') as f:
+                    info = json.load(f)
+            except (OSError, ValueError):
+                info = None
+            if not isinstance(info, dict):
+                info = {}
+            if info.get("version") == SEGMENT_CACHE_VERSION and \
+                    info.get("config") != self.config_fingerprint:
+                continue
+            for file_name in names:
+                try:
+                    os.remove(os.path.join(self.directory, file_name))
+                except OSError:
+                    pass